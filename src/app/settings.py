@@ -157,6 +157,8 @@ SPECTACULAR_SETTINGS = {
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,
 }
+# Written at startup by `manage.py spectacular --file schema.yml`
+SPECTACULAR_SCHEMA_FILE = BASE_DIR / "schema.yml"
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
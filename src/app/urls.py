@@ -1,10 +1,15 @@
 from django.contrib import admin
-from django.urls import include, path, reverse_lazy
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from django.urls import include, path
+from drf_spectacular.views import SpectacularSwaggerView
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.permissions import IsAdminUser, IsAuthenticated, AllowAny
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from core.views import BakedSpectacularAPIView
+
+# Ask for YAML explicitly so the docs pages get the pre-built schema file
+SCHEMA_YAML_URL = "/docs/schema.yml?format=yaml"
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("auth/", include(("users.urls", "users"))),
@@ -14,7 +19,7 @@ urlpatterns = [
     path("api/v1/chart-analysis/", include(("chart_analysis.urls", "chart_analysis"))),
     path(
         "docs/schema.yml",
-        SpectacularAPIView.as_view(
+        BakedSpectacularAPIView.as_view(
             permission_classes=[IsAuthenticated, IsAdminUser],
             authentication_classes=[SessionAuthentication],
         ),
@@ -23,7 +28,7 @@ urlpatterns = [
     path(
         "docs/",
         SpectacularSwaggerView.as_view(
-            url_name="schema",
+            url=SCHEMA_YAML_URL,
             permission_classes=[IsAuthenticated, IsAdminUser],
             authentication_classes=[SessionAuthentication],
         ),
@@ -32,7 +37,7 @@ urlpatterns = [
     path(
         "api/docs/",
         SpectacularSwaggerView.as_view(
-            url=reverse_lazy("schema"),
+            url=SCHEMA_YAML_URL,
             permission_classes=[AllowAny],
             authentication_classes=[JWTAuthentication, SessionAuthentication],
         ),
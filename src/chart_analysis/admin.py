@@ -12,6 +12,21 @@ from .models import (
 )
 
 
+class ChangeListOnlyMixin:
+    """
+    Loads only the columns the changelist renders; the change form still
+    gets full rows
+    """
+    changelist_only_fields = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if self.changelist_only_fields and match and match.url_name.endswith('_changelist'):
+            queryset = queryset.only(*self.changelist_only_fields)
+        return queryset
+
+
 @admin.register(Pair)
 class PairAdmin(admin.ModelAdmin):
     list_display = ('name', 'display_name', 'is_active')
@@ -22,22 +37,35 @@ class PairAdmin(admin.ModelAdmin):
 @admin.register(ChartAnalysis)
 class ChartAnalysisAdmin(admin.ModelAdmin):
     list_display = ('pair', 'user', 'timeframe', 'current_price', 'overall_signal', 'volatility_level', 'created')
+    list_select_related = ('pair', 'user')
+    autocomplete_fields = ('pair', 'user')
     list_filter = ('timeframe', 'overall_signal', 'volatility_level')
     search_fields = ('pair__name', 'user__email')
     date_hierarchy = 'created'
 
+    def get_queryset(self, request):
+        # analysis_data is never shown on the changelist and can be large
+        return super().get_queryset(request).defer('analysis_data')
+
 
 @admin.register(SavedIndicator)
 class SavedIndicatorAdmin(admin.ModelAdmin):
     list_display = ('user', 'pair', 'indicator_type', 'created')
+    list_select_related = ('user', 'pair')
+    autocomplete_fields = ('user', 'pair')
     list_filter = ('indicator_type',)
     search_fields = ('user__email', 'pair__name')
     date_hierarchy = 'created'
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('settings')
+
 
 @admin.register(SupportResistanceLevel)
 class SupportResistanceLevelAdmin(admin.ModelAdmin):
     list_display = ('pair', 'timeframe', 'level_type', 'price_level', 'strength', 'created_by', 'created')
+    list_select_related = ('pair', 'created_by')
+    autocomplete_fields = ('pair', 'created_by')
     list_filter = ('timeframe', 'level_type', 'strength')
     search_fields = ('pair__name', 'created_by__email')
     date_hierarchy = 'created'
@@ -46,6 +74,8 @@ class SupportResistanceLevelAdmin(admin.ModelAdmin):
 @admin.register(SignalPerformance)
 class SignalPerformanceAdmin(admin.ModelAdmin):
     list_display = ('pair', 'user', 'timeframe', 'signal_type', 'result', 'profit_loss', 'entry_time', 'exit_time')
+    list_select_related = ('pair', 'user')
+    autocomplete_fields = ('pair', 'user')
     list_filter = ('timeframe', 'signal_type', 'result')
     search_fields = ('pair__name', 'user__email')
     date_hierarchy = 'entry_time'
@@ -54,24 +84,40 @@ class SignalPerformanceAdmin(admin.ModelAdmin):
 @admin.register(IndicatorPerformance)
 class IndicatorPerformanceAdmin(admin.ModelAdmin):
     list_display = ('user', 'indicator_type', 'pair', 'timeframe', 'accuracy', 'sample_size', 'last_updated')
+    list_select_related = ('user', 'pair')
+    autocomplete_fields = ('user', 'pair')
     list_filter = ('indicator_type', 'timeframe')
     search_fields = ('user__email', 'pair__name')
 
 
 @admin.register(TimeframePerformance)
-class TimeframePerformanceAdmin(admin.ModelAdmin):
+class TimeframePerformanceAdmin(ChangeListOnlyMixin, admin.ModelAdmin):
     list_display = ('user', 'timeframe', 'accuracy', 'win_count', 'loss_count', 'sample_size', 'last_updated')
+    list_select_related = ('user',)
+    changelist_only_fields = (
+        'user', 'user__email', 'timeframe', 'accuracy', 'win_count', 'loss_count',
+        'sample_size', 'last_updated'
+    )
+    autocomplete_fields = ('user',)
     list_filter = ('timeframe',)
     search_fields = ('user__email',)
 
 
 @admin.register(PairPerformance)
-class PairPerformanceAdmin(admin.ModelAdmin):
+class PairPerformanceAdmin(ChangeListOnlyMixin, admin.ModelAdmin):
     list_display = ('user', 'pair', 'accuracy', 'win_count', 'loss_count', 'sample_size', 'last_updated')
+    list_select_related = ('user', 'pair')
+    changelist_only_fields = (
+        'user', 'user__email', 'pair', 'pair__name', 'pair__display_name', 'accuracy',
+        'win_count', 'loss_count', 'sample_size', 'last_updated'
+    )
+    autocomplete_fields = ('user', 'pair')
     search_fields = ('user__email', 'pair__name')
 
 
 @admin.register(RiskAnalysis)
 class RiskAnalysisAdmin(admin.ModelAdmin):
     list_display = ('user', 'win_rate', 'avg_risk_reward', 'max_drawdown', 'profit_factor', 'total_trades', 'last_updated')
+    list_select_related = ('user',)
+    autocomplete_fields = ('user',)
     search_fields = ('user__email',)
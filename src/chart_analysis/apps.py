@@ -5,3 +5,6 @@ class ChartAnalysisConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'chart_analysis'
     verbose_name = 'Chart Analysis'
+
+    def ready(self):
+        from . import signals  # noqa: F401
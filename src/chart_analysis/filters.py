@@ -1,10 +1,16 @@
 import django_filters
-from .models import ChartAnalysis, SavedIndicator
+from .models import Pair, ChartAnalysis, SavedIndicator
+
 
 class ChartAnalysisFilter(django_filters.FilterSet):
     """
     Filter for chart analysis objects
     """
+    # Only the columns the rendered choices need
+    pair = django_filters.ModelChoiceFilter(queryset=Pair.objects.only('id', 'display_name'))
+    # Plain id lookup, so the filter form never lists every user
+    user = django_filters.NumberFilter(field_name='user_id')
+
     class Meta:
         model = ChartAnalysis
         fields = ['pair', 'timeframe', 'user']
@@ -14,6 +20,9 @@ class SavedIndicatorFilter(django_filters.FilterSet):
     """
     Filter for saved indicator objects
     """
+    pair = django_filters.ModelChoiceFilter(queryset=Pair.objects.only('id', 'display_name'))
+    user = django_filters.NumberFilter(field_name='user_id')
+
     class Meta:
         model = SavedIndicator
-        fields = ['pair', 'indicator_type', 'user'] 
\ No newline at end of file
+        fields = ['pair', 'indicator_type', 'user']
@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from chart_analysis.models import Pair
 
 
@@ -55,19 +56,22 @@ class Command(BaseCommand):
             },
         ]
         
-        # Create pairs if they don't exist
-        for pair_data in pairs:
-            pair, created = Pair.objects.get_or_create(
-                name=pair_data['name'],
-                defaults={
-                    'display_name': pair_data['display_name'],
-                    'is_active': pair_data['is_active']
-                }
+        # Create pairs if they don't exist, in a single INSERT
+        names = [pair_data['name'] for pair_data in pairs]
+        with transaction.atomic():
+            existing = set(
+                Pair.objects.filter(name__in=names).values_list('name', flat=True)
             )
-            
-            if created:
-                self.stdout.write(self.style.SUCCESS(f'Created pair: {pair.name}'))
+            Pair.objects.bulk_create(
+                [Pair(**pair_data) for pair_data in pairs],
+                ignore_conflicts=True,
+                batch_size=500
+            )
+        
+        for name in names:
+            if name in existing:
+                self.stdout.write(f'Pair already exists: {name}')
             else:
-                self.stdout.write(f'Pair already exists: {pair.name}')
+                self.stdout.write(self.style.SUCCESS(f'Created pair: {name}'))
         
         self.stdout.write(self.style.SUCCESS('Successfully loaded initial pairs data')) 
\ No newline at end of file
@@ -0,0 +1,166 @@
+import logging
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Avg, Count, Exists, OuterRef, Q, Sum
+from django.utils import timezone
+
+from chart_analysis.models import (
+    SignalPerformance, TimeframePerformance, PairPerformance, RiskAnalysis
+)
+from chart_analysis.utils import clear_analytics_cache
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+WIN = Q(result='win')
+LOSS = Q(result='loss')
+
+
+class Command(BaseCommand):
+    help = 'Recompute stored pair, timeframe and risk performance from closed signals'
+
+    def handle(self, *args, **options):
+        # Open signals have no outcome yet and do not count towards accuracy
+        closed = SignalPerformance.objects.exclude(result='open').order_by()
+        now = timezone.now()
+
+        with transaction.atomic():
+            pairs = self._refresh_counts(
+                PairPerformance, closed, ('user_id', 'pair_id'), now
+            )
+            timeframes = self._refresh_counts(
+                TimeframePerformance, closed, ('user_id', 'timeframe'), now
+            )
+            risks = self._refresh_risk(closed, now)
+
+        # Bulk writes skip the model signals that normally clear these
+        for user_id in closed.values_list('user_id', flat=True).distinct():
+            clear_analytics_cache(user_id)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Refreshed {pairs} pair, {timeframes} timeframe and {risks} risk rows"
+        ))
+
+    def _refresh_counts(self, model, closed, keys, now):
+        """
+        Aggregate win/loss counts per key in one query and upsert the rows
+        """
+        rows = closed.values(*keys).annotate(
+            wins=Count('id', filter=WIN),
+            losses=Count('id', filter=LOSS),
+        )
+        existing = {
+            tuple(getattr(obj, key) for key in keys): obj
+            for obj in self._current_rows(model, closed, keys)
+        }
+
+        to_create, to_update = [], []
+        for row in rows:
+            sample_size = row['wins'] + row['losses']
+            values = {
+                'accuracy': round(row['wins'] * 100 / sample_size, 2),
+                'sample_size': sample_size,
+                'win_count': row['wins'],
+                'loss_count': row['losses'],
+                'last_updated': now,
+                'updated': now,
+            }
+            obj = existing.get(tuple(row[key] for key in keys))
+            if obj is None:
+                to_create.append(model(**{key: row[key] for key in keys}, **values))
+            else:
+                for field, value in values.items():
+                    setattr(obj, field, value)
+                to_update.append(obj)
+
+        model.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        model.objects.bulk_update(
+            to_update,
+            ['accuracy', 'sample_size', 'win_count', 'loss_count', 'last_updated', 'updated'],
+            batch_size=BATCH_SIZE
+        )
+        return len(to_create) + len(to_update)
+
+    def _refresh_risk(self, closed, now):
+        """
+        Aggregate per-user risk metrics and upsert one RiskAnalysis row per user
+        """
+        rows = closed.values('user_id').annotate(
+            wins=Count('id', filter=WIN),
+            losses=Count('id', filter=LOSS),
+            gross_win=Sum('profit_loss', filter=WIN),
+            gross_loss=Sum('profit_loss', filter=LOSS),
+            avg_win=Avg('profit_loss', filter=WIN),
+            avg_loss=Avg('profit_loss', filter=LOSS),
+        )
+        drawdowns = self._max_drawdowns(closed)
+        existing = {
+            obj.user_id: obj
+            for obj in self._current_rows(RiskAnalysis, closed, ('user_id',))
+        }
+
+        fields = [
+            'win_rate', 'avg_risk_reward', 'max_drawdown', 'profit_factor',
+            'total_trades', 'winning_trades', 'losing_trades',
+            'avg_win_size', 'avg_loss_size', 'last_updated', 'updated'
+        ]
+        to_create, to_update = [], []
+        for row in rows:
+            total = row['wins'] + row['losses']
+            avg_win = row['avg_win'] or 0
+            avg_loss = abs(row['avg_loss'] or 0)
+            gross_loss = abs(row['gross_loss'] or 0)
+            values = {
+                'win_rate': round(row['wins'] * 100 / total, 2),
+                'avg_risk_reward': round(avg_win / avg_loss, 2) if avg_loss else 0,
+                'max_drawdown': round(drawdowns.get(row['user_id'], 0), 2),
+                'profit_factor': round((row['gross_win'] or 0) / gross_loss, 2) if gross_loss else 0,
+                'total_trades': total,
+                'winning_trades': row['wins'],
+                'losing_trades': row['losses'],
+                'avg_win_size': round(avg_win, 2),
+                'avg_loss_size': round(avg_loss, 2),
+                'last_updated': now,
+                'updated': now,
+            }
+            obj = existing.get(row['user_id'])
+            if obj is None:
+                to_create.append(RiskAnalysis(user_id=row['user_id'], **values))
+            else:
+                for field, value in values.items():
+                    setattr(obj, field, value)
+                to_update.append(obj)
+
+        RiskAnalysis.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        RiskAnalysis.objects.bulk_update(to_update, fields, batch_size=BATCH_SIZE)
+        return len(to_create) + len(to_update)
+
+    def _current_rows(self, model, closed, keys):
+        """
+        Delete the stored rows whose key no longer has any closed signals and
+        return the remaining ones, which are exactly the keys being refreshed
+        """
+        has_signals = Exists(closed.filter(**{key: OuterRef(key) for key in keys}))
+        # Deleting sends post_delete, which clears those users' cached analytics
+        model.objects.exclude(has_signals).delete()
+        return model.objects.filter(has_signals).only('id', *keys)
+
+    def _max_drawdowns(self, closed):
+        """
+        Walk each user's closed signals in exit order and track the deepest
+        drop of cumulative profit/loss from its running peak
+        """
+        drawdowns = {}
+        user_id = None
+        for row_user_id, profit_loss in closed.filter(
+            profit_loss__isnull=False
+        ).order_by('user_id', 'exit_time', 'id').values_list(
+            'user_id', 'profit_loss'
+        ).iterator(chunk_size=BATCH_SIZE):
+            if row_user_id != user_id:
+                user_id, equity, peak = row_user_id, 0.0, 0.0
+                drawdowns[user_id] = 0.0
+            equity += profit_loss
+            peak = max(peak, equity)
+            drawdowns[user_id] = max(drawdowns[user_id], peak - equity)
+        return drawdowns
@@ -0,0 +1,198 @@
+# Generated by Django 5.0.7 on 2026-10-15 07:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Pair',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=20, unique=True)),
+                ('display_name', models.CharField(max_length=50)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RiskAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('win_rate', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('avg_risk_reward', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('max_drawdown', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('profit_factor', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('total_trades', models.IntegerField(default=0)),
+                ('winning_trades', models.IntegerField(default=0)),
+                ('losing_trades', models.IntegerField(default=0)),
+                ('avg_win_size', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('avg_loss_size', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='SignalPerformance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('timeframe', models.CharField(choices=[('1m', '1 Minute'), ('5m', '5 Minutes'), ('15m', '15 Minutes'), ('30m', '30 Minutes'), ('1h', '1 Hour'), ('4h', '4 Hours'), ('1d', '1 Day'), ('1w', '1 Week'), ('1mo', '1 Month')], default='1h', max_length=5)),
+                ('signal_type', models.CharField(choices=[('buy', 'Buy'), ('sell', 'Sell')], max_length=10)),
+                ('entry_price', models.DecimalField(decimal_places=6, max_digits=12)),
+                ('exit_price', models.DecimalField(blank=True, decimal_places=6, max_digits=12, null=True)),
+                ('target_price', models.DecimalField(decimal_places=6, max_digits=12)),
+                ('stop_loss', models.DecimalField(decimal_places=6, max_digits=12)),
+                ('entry_time', models.DateTimeField()),
+                ('exit_time', models.DateTimeField(blank=True, null=True)),
+                ('result', models.CharField(choices=[('win', 'Win'), ('loss', 'Loss'), ('open', 'Open')], default='open', max_length=10)),
+                ('profit_loss', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='chart_analysis.pair')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Signal Performances',
+            },
+        ),
+        migrations.CreateModel(
+            name='SupportResistanceLevel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('timeframe', models.CharField(choices=[('1m', '1 Minute'), ('5m', '5 Minutes'), ('15m', '15 Minutes'), ('30m', '30 Minutes'), ('1h', '1 Hour'), ('4h', '4 Hours'), ('1d', '1 Day'), ('1w', '1 Week'), ('1mo', '1 Month')], default='1h', max_length=5)),
+                ('level_type', models.CharField(choices=[('support', 'Support'), ('resistance', 'Resistance')], max_length=10)),
+                ('price_level', models.DecimalField(decimal_places=6, max_digits=12)),
+                ('strength', models.IntegerField(default=1)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='chart_analysis.pair')),
+            ],
+            options={
+                'ordering': ['-created'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='IndicatorPerformance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('indicator_type', models.CharField(choices=[('rsi', 'Relative Strength Index'), ('macd', 'MACD'), ('bollinger', 'Bollinger Bands'), ('ma', 'Moving Average'), ('ema', 'Exponential Moving Average'), ('stoch', 'Stochastic Oscillator'), ('adx', 'Average Directional Index'), ('ichimoku', 'Ichimoku Cloud'), ('fib', 'Fibonacci Retracement')], max_length=20)),
+                ('timeframe', models.CharField(choices=[('1m', '1 Minute'), ('5m', '5 Minutes'), ('15m', '15 Minutes'), ('30m', '30 Minutes'), ('1h', '1 Hour'), ('4h', '4 Hours'), ('1d', '1 Day'), ('1w', '1 Week'), ('1mo', '1 Month')], default='1h', max_length=5)),
+                ('accuracy', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('sample_size', models.IntegerField(default=0)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='chart_analysis.pair')),
+            ],
+            options={
+                'unique_together': {('user', 'indicator_type', 'timeframe', 'pair')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ChartAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('timeframe', models.CharField(choices=[('1m', '1 Minute'), ('5m', '5 Minutes'), ('15m', '15 Minutes'), ('30m', '30 Minutes'), ('1h', '1 Hour'), ('4h', '4 Hours'), ('1d', '1 Day'), ('1w', '1 Week'), ('1mo', '1 Month')], default='1h', max_length=5)),
+                ('current_price', models.DecimalField(decimal_places=6, max_digits=12)),
+                ('change_24h', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('high_24h', models.DecimalField(decimal_places=6, max_digits=12)),
+                ('low_24h', models.DecimalField(decimal_places=6, max_digits=12)),
+                ('analysis_data', models.JSONField(default=dict)),
+                ('overall_signal', models.CharField(choices=[('buy', 'Buy'), ('sell', 'Sell'), ('neutral', 'Neutral')], max_length=10)),
+                ('volatility_level', models.CharField(choices=[('low', 'Low'), ('moderate', 'Moderate'), ('high', 'High')], max_length=10)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='chart_analysis.pair')),
+            ],
+            options={
+                'verbose_name_plural': 'Chart Analyses',
+                'unique_together': {('pair', 'user', 'timeframe')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PairPerformance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('accuracy', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('sample_size', models.IntegerField(default=0)),
+                ('win_count', models.IntegerField(default=0)),
+                ('loss_count', models.IntegerField(default=0)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='chart_analysis.pair')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'pair')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedIndicator',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('indicator_type', models.CharField(choices=[('rsi', 'Relative Strength Index'), ('macd', 'MACD'), ('bollinger', 'Bollinger Bands'), ('ma', 'Moving Average'), ('ema', 'Exponential Moving Average'), ('stoch', 'Stochastic Oscillator'), ('adx', 'Average Directional Index'), ('ichimoku', 'Ichimoku Cloud'), ('fib', 'Fibonacci Retracement')], max_length=20)),
+                ('settings', models.JSONField(default=dict)),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='chart_analysis.pair')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'pair', 'indicator_type')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TimeframePerformance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('timeframe', models.CharField(choices=[('1m', '1 Minute'), ('5m', '5 Minutes'), ('15m', '15 Minutes'), ('30m', '30 Minutes'), ('1h', '1 Hour'), ('4h', '4 Hours'), ('1d', '1 Day'), ('1w', '1 Week'), ('1mo', '1 Month')], max_length=5)),
+                ('accuracy', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('sample_size', models.IntegerField(default=0)),
+                ('win_count', models.IntegerField(default=0)),
+                ('loss_count', models.IntegerField(default=0)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'timeframe')},
+            },
+        ),
+        migrations.CreateModel(
+            name='UserIndicatorSettings',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('indicator_type', models.CharField(choices=[('rsi', 'Relative Strength Index'), ('macd', 'MACD'), ('bollinger', 'Bollinger Bands'), ('ma', 'Moving Average'), ('ema', 'Exponential Moving Average'), ('stoch', 'Stochastic Oscillator'), ('adx', 'Average Directional Index'), ('ichimoku', 'Ichimoku Cloud'), ('fib', 'Fibonacci Retracement')], max_length=20)),
+                ('weight', models.DecimalField(decimal_places=1, default=0.5, max_digits=3)),
+                ('is_active', models.BooleanField(default=True)),
+                ('indicator_parameters', models.JSONField(default=dict)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'User Indicator Settings',
+                'unique_together': {('user', 'indicator_type')},
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.7 on 2026-10-15 07:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chart_analysis', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chartanalysis',
+            index=models.Index(fields=['user', '-created'], name='chart_analy_user_id_e329ca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='chartanalysis',
+            index=models.Index(fields=['-created'], name='chart_analy_created_ec5617_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedindicator',
+            index=models.Index(fields=['user', '-created'], name='chart_analy_user_id_31f0ae_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signalperformance',
+            index=models.Index(fields=['user', 'pair', 'timeframe', 'result'], name='chart_analy_user_id_5fe590_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signalperformance',
+            index=models.Index(condition=models.Q(('result', 'open')), fields=['user'], name='sigperf_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signalperformance',
+            index=models.Index(fields=['-entry_time'], name='chart_analy_entry_t_99ce59_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supportresistancelevel',
+            index=models.Index(fields=['created_by', 'pair', 'timeframe', 'price_level'], name='chart_analy_created_40f634_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supportresistancelevel',
+            index=models.Index(fields=['pair', 'timeframe', 'level_type'], name='chart_analy_pair_id_ba6574_idx'),
+        ),
+    ]
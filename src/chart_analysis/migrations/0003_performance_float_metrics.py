@@ -0,0 +1,63 @@
+# Generated by Django 5.0.7 on 2026-10-15 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chart_analysis', '0002_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='indicatorperformance',
+            name='accuracy',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='pairperformance',
+            name='accuracy',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='riskanalysis',
+            name='avg_loss_size',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='riskanalysis',
+            name='avg_risk_reward',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='riskanalysis',
+            name='avg_win_size',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='riskanalysis',
+            name='max_drawdown',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='riskanalysis',
+            name='profit_factor',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='riskanalysis',
+            name='win_rate',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='signalperformance',
+            name='profit_loss',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='timeframeperformance',
+            name='accuracy',
+            field=models.FloatField(),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.0.7 on 2026-10-15 07:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chart_analysis', '0003_performance_float_metrics'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='chartanalysis',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='indicatorperformance',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='pairperformance',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='savedindicator',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='timeframeperformance',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='userindicatorsettings',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='chartanalysis',
+            constraint=models.UniqueConstraint(fields=('pair', 'user', 'timeframe'), name='ca_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='indicatorperformance',
+            constraint=models.UniqueConstraint(fields=('user', 'indicator_type', 'timeframe', 'pair'), name='indperf_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='pairperformance',
+            constraint=models.UniqueConstraint(fields=('user', 'pair'), name='pairperf_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='savedindicator',
+            constraint=models.UniqueConstraint(fields=('user', 'pair', 'indicator_type'), name='savedind_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='timeframeperformance',
+            constraint=models.UniqueConstraint(fields=('user', 'timeframe'), name='tfperf_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='userindicatorsettings',
+            constraint=models.UniqueConstraint(fields=('user', 'indicator_type'), name='indsettings_uniq'),
+        ),
+    ]
@@ -1,8 +1,29 @@
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
 from core.models import BaseModel
 
 
+def _pair_name(obj):
+    """
+    Name of obj's pair without a per-row query when the pair isn't joined
+    """
+    if obj._meta.get_field('pair').is_cached(obj):
+        return obj.pair.name
+    from .utils import get_pairs_by_id
+    names = get_pairs_by_id().get(obj.pair_id)
+    return names[0] if names else f"pair#{obj.pair_id}"
+
+
+def _user_email(obj):
+    """
+    Email of obj's user if already loaded, otherwise just its id
+    """
+    if obj._meta.get_field('user').is_cached(obj):
+        return obj.user.email
+    return f"user#{obj.user_id}"
+
+
 class Pair(models.Model):
     """
     Model representing a trading pair (e.g., EUR/USD)
@@ -59,11 +80,16 @@ class UserIndicatorSettings(BaseModel):
     indicator_parameters = models.JSONField(default=dict)
     
     class Meta:
-        unique_together = ('user', 'indicator_type')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'indicator_type'],
+                name='indsettings_uniq'
+            ),
+        ]
         verbose_name_plural = 'User Indicator Settings'
     
     def __str__(self):
-        return f"{self.indicator_type} settings for {self.user.email} (Weight: {self.weight})"
+        return f"{self.indicator_type} settings for {_user_email(self)} (Weight: {self.weight})"
 
 
 class ChartAnalysis(BaseModel):
@@ -106,11 +132,20 @@ class ChartAnalysis(BaseModel):
     )
     
     class Meta:
-        unique_together = ('pair', 'user', 'timeframe')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['pair', 'user', 'timeframe'],
+                name='ca_uniq'
+            ),
+        ]
         verbose_name_plural = 'Chart Analyses'
+        indexes = [
+            models.Index(fields=['user', '-created']),
+            models.Index(fields=['-created']),
+        ]
     
     def __str__(self):
-        return f"{self.pair.name} {self.timeframe} - {self.user.email}"
+        return f"{_pair_name(self)} {self.timeframe} - {_user_email(self)}"
 
 
 class SavedIndicator(BaseModel):
@@ -126,10 +161,18 @@ class SavedIndicator(BaseModel):
     settings = models.JSONField(default=dict)
     
     class Meta:
-        unique_together = ('user', 'pair', 'indicator_type')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'pair', 'indicator_type'],
+                name='savedind_uniq'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-created']),
+        ]
     
     def __str__(self):
-        return f"{self.indicator_type} for {self.pair.name} - {self.user.email}"
+        return f"{self.indicator_type} for {_pair_name(self)} - {_user_email(self)}"
 
 
 class SupportResistanceLevel(BaseModel):
@@ -153,8 +196,14 @@ class SupportResistanceLevel(BaseModel):
     strength = models.IntegerField(default=1)  # 1-10 scale
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     
+    class Meta(BaseModel.Meta):
+        indexes = [
+            models.Index(fields=['created_by', 'pair', 'timeframe', 'price_level']),
+            models.Index(fields=['pair', 'timeframe', 'level_type']),
+        ]
+    
     def __str__(self):
-        return f"{self.get_level_type_display()} at {self.price_level} for {self.pair.name}"
+        return f"{self.get_level_type_display()} at {self.price_level} for {_pair_name(self)}"
 
 
 # Advanced Analytics Models
@@ -192,13 +241,18 @@ class SignalPerformance(BaseModel):
         ],
         default='open'
     )
-    profit_loss = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)  # Percentage
+    profit_loss = models.FloatField(null=True, blank=True)  # Percentage
     
     class Meta:
         verbose_name_plural = 'Signal Performances'
+        indexes = [
+            models.Index(fields=['user', 'pair', 'timeframe', 'result']),
+            models.Index(fields=['user'], condition=Q(result='open'), name='sigperf_open_idx'),
+            models.Index(fields=['-entry_time']),
+        ]
     
     def __str__(self):
-        return f"{self.pair.name} {self.timeframe} {self.signal_type} - {self.result}"
+        return f"{_pair_name(self)} {self.timeframe} {self.signal_type} - {self.result}"
 
 
 class IndicatorPerformance(BaseModel):
@@ -216,15 +270,20 @@ class IndicatorPerformance(BaseModel):
         default=Timeframe.ONE_HOUR
     )
     pair = models.ForeignKey(Pair, on_delete=models.CASCADE)
-    accuracy = models.DecimalField(max_digits=5, decimal_places=2)  # Percentage
+    accuracy = models.FloatField()  # Percentage
     sample_size = models.IntegerField(default=0)
     last_updated = models.DateTimeField(auto_now=True)
     
     class Meta:
-        unique_together = ('user', 'indicator_type', 'timeframe', 'pair')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'indicator_type', 'timeframe', 'pair'],
+                name='indperf_uniq'
+            ),
+        ]
     
     def __str__(self):
-        return f"{self.indicator_type} on {self.pair.name} {self.timeframe} - {self.accuracy}%"
+        return f"{self.indicator_type} on {_pair_name(self)} {self.timeframe} - {self.accuracy}%"
 
 
 class TimeframePerformance(BaseModel):
@@ -236,14 +295,19 @@ class TimeframePerformance(BaseModel):
         max_length=5,
         choices=Timeframe.choices
     )
-    accuracy = models.DecimalField(max_digits=5, decimal_places=2)  # Percentage
+    accuracy = models.FloatField()  # Percentage
     sample_size = models.IntegerField(default=0)
     win_count = models.IntegerField(default=0)
     loss_count = models.IntegerField(default=0)
     last_updated = models.DateTimeField(auto_now=True)
     
     class Meta:
-        unique_together = ('user', 'timeframe')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'timeframe'],
+                name='tfperf_uniq'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.timeframe} - {self.accuracy}%"
@@ -255,17 +319,22 @@ class PairPerformance(BaseModel):
     """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     pair = models.ForeignKey(Pair, on_delete=models.CASCADE)
-    accuracy = models.DecimalField(max_digits=5, decimal_places=2)  # Percentage
+    accuracy = models.FloatField()  # Percentage
     sample_size = models.IntegerField(default=0)
     win_count = models.IntegerField(default=0)
     loss_count = models.IntegerField(default=0)
     last_updated = models.DateTimeField(auto_now=True)
     
     class Meta:
-        unique_together = ('user', 'pair')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'pair'],
+                name='pairperf_uniq'
+            ),
+        ]
     
     def __str__(self):
-        return f"{self.pair.name} - {self.accuracy}%"
+        return f"{_pair_name(self)} - {self.accuracy}%"
 
 
 class RiskAnalysis(BaseModel):
@@ -274,16 +343,16 @@ class RiskAnalysis(BaseModel):
     """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     # Risk metrics
-    win_rate = models.DecimalField(max_digits=5, decimal_places=2)  # Percentage
-    avg_risk_reward = models.DecimalField(max_digits=5, decimal_places=2)  # e.g. 1:2.5
-    max_drawdown = models.DecimalField(max_digits=5, decimal_places=2)  # Percentage
-    profit_factor = models.DecimalField(max_digits=5, decimal_places=2)  # e.g. 2.1
+    win_rate = models.FloatField()  # Percentage
+    avg_risk_reward = models.FloatField()  # e.g. 1:2.5
+    max_drawdown = models.FloatField()  # Percentage
+    profit_factor = models.FloatField()  # e.g. 2.1
     total_trades = models.IntegerField(default=0)
     winning_trades = models.IntegerField(default=0)
     losing_trades = models.IntegerField(default=0)
-    avg_win_size = models.DecimalField(max_digits=5, decimal_places=2)  # Percentage
-    avg_loss_size = models.DecimalField(max_digits=5, decimal_places=2)  # Percentage
+    avg_win_size = models.FloatField()  # Percentage
+    avg_loss_size = models.FloatField()  # Percentage
     last_updated = models.DateTimeField(auto_now=True)
     
     def __str__(self):
-        return f"Risk Analysis for {self.user.email}"
+        return f"Risk Analysis for {_user_email(self)}"
@@ -1,3 +1,6 @@
+from django.db import models
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from .models import (
     Pair, 
@@ -13,6 +16,21 @@ from .models import (
     RiskAnalysis,
     UserIndicatorSettings
 )
+from .utils import get_pairs_by_id
+
+
+class EagerLoadingMixin:
+    """
+    Lets views apply the joins a serializer needs before rows are iterated,
+    so related fields read during serialization don't cost a query per row
+    """
+    select_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        return queryset
 
 
 class PairSerializer(serializers.ModelSerializer):
@@ -24,12 +42,90 @@ class PairSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'display_name', 'is_active']
 
 
-class ChartAnalysisSerializer(serializers.ModelSerializer):
+class PairDetailsMixin:
+    """
+    Serializes the related pair once per distinct pair_id and reuses the
+    result for every other row of the same serializer pass
+    """
+    @extend_schema_field(PairSerializer)
+    def get_pair_details(self, obj):
+        cache = self.context.setdefault('pair_details', {})
+        details = cache.get(obj.pair_id)
+        if details is None:
+            details = cache[obj.pair_id] = PairSerializer(obj.pair).data
+        return details
+
+
+class PairNameMixin:
+    """
+    Reads pair names from the per-process pair cache instead of joining
+    the pair table for every row
+    """
+    def _pair_names(self, obj):
+        names = get_pairs_by_id().get(obj.pair_id)
+        if names is None:
+            # Pair created in another process since the cache was filled
+            names = (obj.pair.name, obj.pair.display_name)
+        return names
+
+    def get_pair_name(self, obj) -> str:
+        return self._pair_names(obj)[0]
+
+    def get_pair_display_name(self, obj) -> str:
+        return self._pair_names(obj)[1]
+
+
+class ValuesDataMixin:
+    """
+    Builds the same output as `Serializer(queryset, many=True).data` from
+    queryset.values(), for read-only listings that don't need the per-row
+    field pipeline. Handles plain columns, foreign key ids, `*_display`
+    choice labels and `pair_details`
+    """
+    _datetime_field = serializers.DateTimeField()
+    # Rows fetched per round trip, so raw rows are dropped as they are converted
+    values_chunk_size = 2000
+
+    @classmethod
+    def values_data(cls, queryset):
+        opts = cls.Meta.model._meta
+        columns, converters = set(), []
+        for name in cls.Meta.fields:
+            if name == 'pair_details':
+                columns.update(['pair', 'pair__name', 'pair__display_name', 'pair__is_active'])
+                converters.append((name, lambda row: {
+                    'id': row['pair'],
+                    'name': row['pair__name'],
+                    'display_name': row['pair__display_name'],
+                    'is_active': row['pair__is_active'],
+                }))
+            elif name.endswith('_display'):
+                source = name[:-len('_display')]
+                labels = {value: str(label) for value, label in opts.get_field(source).flatchoices}
+                columns.add(source)
+                converters.append((name, lambda row, source=source, labels=labels: labels.get(row[source], row[source])))
+            elif isinstance(opts.get_field(name), models.DateTimeField):
+                columns.add(name)
+                converters.append((name, lambda row, name=name: (
+                    cls._datetime_field.to_representation(row[name]) if row[name] else None
+                )))
+            else:
+                columns.add(name)
+                converters.append((name, lambda row, name=name: row[name]))
+        return [
+            {name: convert(row) for name, convert in converters}
+            for row in queryset.values(*columns).iterator(chunk_size=cls.values_chunk_size)
+        ]
+
+
+class ChartAnalysisSerializer(EagerLoadingMixin, PairNameMixin, serializers.ModelSerializer):
     """
     Serializer for chart analysis
     """
-    pair_name = serializers.CharField(source='pair.name', read_only=True)
-    pair_display_name = serializers.CharField(source='pair.display_name', read_only=True)
+    # Owner comes from the request, but still feeds the unique-together check
+    user = serializers.HiddenField(default=serializers.CurrentUserDefault())
+    pair_name = serializers.SerializerMethodField()
+    pair_display_name = serializers.SerializerMethodField()
     timeframe_display = serializers.CharField(source='get_timeframe_display', read_only=True)
     overall_signal_display = serializers.CharField(source='get_overall_signal_display', read_only=True)
     volatility_level_display = serializers.CharField(source='get_volatility_level_display', read_only=True)
@@ -37,33 +133,78 @@ class ChartAnalysisSerializer(serializers.ModelSerializer):
     class Meta:
         model = ChartAnalysis
         fields = [
-            'id', 'pair', 'pair_name', 'pair_display_name', 'timeframe', 'timeframe_display',
+            'id', 'pair', 'pair_name', 'pair_display_name', 'user', 'timeframe', 'timeframe_display',
             'current_price', 'change_24h', 'high_24h', 'low_24h',
             'analysis_data', 'overall_signal', 'overall_signal_display',
             'volatility_level', 'volatility_level_display',
-            'created_at', 'updated_at'
+            'created', 'updated'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['created', 'updated']
 
 
-class SavedIndicatorSerializer(serializers.ModelSerializer):
+class ChartAnalysisListSerializer(ChartAnalysisSerializer):
+    """
+    Serializer for chart analysis listings, without the analysis_data payload
+    """
+    class Meta(ChartAnalysisSerializer.Meta):
+        fields = [
+            field for field in ChartAnalysisSerializer.Meta.fields
+            if field != 'analysis_data'
+        ]
+
+
+class SavedIndicatorSerializer(EagerLoadingMixin, PairNameMixin, serializers.ModelSerializer):
     """
     Serializer for saved indicators
     """
-    pair_name = serializers.CharField(source='pair.name', read_only=True)
+    user = serializers.PrimaryKeyRelatedField(read_only=True, default=serializers.CurrentUserDefault())
+    pair_name = serializers.SerializerMethodField()
     indicator_type_display = serializers.CharField(source='get_indicator_type_display', read_only=True)
     
     class Meta:
         model = SavedIndicator
         fields = [
-            'id', 'pair', 'pair_name', 'user', 'timeframe',
-            'indicator_type', 'indicator_type_display', 'parameters',
-            'created_at', 'updated_at'
+            'id', 'pair', 'pair_name', 'user',
+            'indicator_type', 'indicator_type_display', 'settings',
+            'created', 'updated'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['created', 'updated']
+
+
+class UserIndicatorSettingsListSerializer(serializers.ListSerializer):
+    """
+    Applies a batch of partial updates with one bulk_update. The instance is
+    a dict of the user's settings keyed by str(id), and every item in the
+    data must carry the id of one of them
+    """
+    def run_child_validation(self, data):
+        self.child.instance = self.instance[str(data['id'])]
+        self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def update(self, instance, validated_data):
+        now = timezone.now()
+        changed_fields = {'updated'}
+        updated = []
+        for data, attrs in zip(self.initial_data, validated_data):
+            setting = instance[str(data['id'])]
+            for field, value in attrs.items():
+                setattr(setting, field, value)
+            # bulk_update skips auto_now, so stamp it here
+            setting.updated = now
+            changed_fields.update(attrs)
+            updated.append(setting)
+
+        self.child.Meta.model.objects.bulk_update(
+            {setting.id: setting for setting in updated}.values(),
+            changed_fields,
+            batch_size=500
+        )
+        return updated
 
 
 class UserIndicatorSettingsSerializer(serializers.ModelSerializer):
+    user = serializers.PrimaryKeyRelatedField(read_only=True, default=serializers.CurrentUserDefault())
     indicator_name = serializers.CharField(source='get_indicator_type_display', read_only=True)
     
     class Meta:
@@ -71,27 +212,29 @@ class UserIndicatorSettingsSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'user', 'indicator_type', 'indicator_name', 
             'weight', 'is_active', 'indicator_parameters', 
-            'created_at', 'updated_at'
+            'created', 'updated'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['created', 'updated']
+        list_serializer_class = UserIndicatorSettingsListSerializer
 
 
-class SupportResistanceLevelSerializer(serializers.ModelSerializer):
+class SupportResistanceLevelSerializer(EagerLoadingMixin, PairNameMixin, serializers.ModelSerializer):
     """
     Serializer for support and resistance levels
     """
-    pair_name = serializers.CharField(source='pair.name', read_only=True)
+    created_by = serializers.PrimaryKeyRelatedField(read_only=True, default=serializers.CurrentUserDefault())
+    pair_name = serializers.SerializerMethodField()
     timeframe_display = serializers.CharField(source='get_timeframe_display', read_only=True)
     level_type_display = serializers.CharField(source='get_level_type_display', read_only=True)
     
     class Meta:
         model = SupportResistanceLevel
         fields = [
-            'id', 'pair', 'pair_name', 'user', 'timeframe', 'timeframe_display',
+            'id', 'pair', 'pair_name', 'created_by', 'timeframe', 'timeframe_display',
             'level_type', 'level_type_display', 'price_level', 'strength',
-            'created_at', 'updated_at'
+            'created', 'updated'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['created', 'updated']
 
 
 class IndicatorChoiceSerializer(serializers.Serializer):
@@ -112,11 +255,14 @@ class TimeframeChoiceSerializer(serializers.Serializer):
 
 # Advanced Analytics Serializers
 
-class SignalPerformanceSerializer(serializers.ModelSerializer):
+class SignalPerformanceSerializer(EagerLoadingMixin, PairDetailsMixin, serializers.ModelSerializer):
     """
     Serializer for signal performance tracking
     """
-    pair_details = PairSerializer(source='pair', read_only=True)
+    select_related_fields = ('pair',)
+
+    user = serializers.PrimaryKeyRelatedField(read_only=True, default=serializers.CurrentUserDefault())
+    pair_details = serializers.SerializerMethodField()
     timeframe_display = serializers.CharField(source='get_timeframe_display', read_only=True)
     result_display = serializers.CharField(source='get_result_display', read_only=True)
     signal_type_display = serializers.CharField(source='get_signal_type_display', read_only=True)
@@ -132,11 +278,13 @@ class SignalPerformanceSerializer(serializers.ModelSerializer):
         read_only_fields = ['created', 'updated']
 
 
-class IndicatorPerformanceSerializer(serializers.ModelSerializer):
+class IndicatorPerformanceSerializer(EagerLoadingMixin, PairDetailsMixin, ValuesDataMixin, serializers.ModelSerializer):
     """
     Serializer for indicator performance
     """
-    pair_details = PairSerializer(source='pair', read_only=True)
+    select_related_fields = ('pair',)
+
+    pair_details = serializers.SerializerMethodField()
     indicator_type_display = serializers.CharField(source='get_indicator_type_display', read_only=True)
     timeframe_display = serializers.CharField(source='get_timeframe_display', read_only=True)
     
@@ -150,7 +298,7 @@ class IndicatorPerformanceSerializer(serializers.ModelSerializer):
         read_only_fields = ['created', 'updated', 'last_updated']
 
 
-class TimeframePerformanceSerializer(serializers.ModelSerializer):
+class TimeframePerformanceSerializer(ValuesDataMixin, serializers.ModelSerializer):
     """
     Serializer for timeframe performance
     """
@@ -166,11 +314,13 @@ class TimeframePerformanceSerializer(serializers.ModelSerializer):
         read_only_fields = ['created', 'updated', 'last_updated']
 
 
-class PairPerformanceSerializer(serializers.ModelSerializer):
+class PairPerformanceSerializer(EagerLoadingMixin, PairDetailsMixin, ValuesDataMixin, serializers.ModelSerializer):
     """
     Serializer for pair performance
     """
-    pair_details = PairSerializer(source='pair', read_only=True)
+    select_related_fields = ('pair',)
+
+    pair_details = serializers.SerializerMethodField()
     
     class Meta:
         model = PairPerformance
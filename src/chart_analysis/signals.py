@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import (
+    Pair, IndicatorPerformance, TimeframePerformance, PairPerformance, RiskAnalysis
+)
+from .utils import clear_analytics_cache, get_active_pairs, get_pairs_by_id
+
+
+@receiver([post_save, post_delete], sender=Pair)
+def clear_pairs_cache(sender, **kwargs):
+    """
+    Drop the cached pairs whenever a pair changes
+    """
+    get_pairs_by_id.cache_clear()
+    get_active_pairs.cache_clear()
+
+
+@receiver([post_save, post_delete], sender=IndicatorPerformance)
+@receiver([post_save, post_delete], sender=TimeframePerformance)
+@receiver([post_save, post_delete], sender=PairPerformance)
+@receiver([post_save, post_delete], sender=RiskAnalysis)
+def clear_user_analytics_cache(sender, instance, **kwargs):
+    """
+    Drop the user's cached analytics whenever a stored metric changes
+    """
+    clear_analytics_cache(instance.user_id)
@@ -1,5 +1,5 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from .views import (
     PairViewSet,
     ChartAnalysisViewSet,
@@ -10,7 +10,7 @@ from .views import (
     UserIndicatorSettingsViewSet
 )
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'pairs', PairViewSet)
 router.register(r'analysis', ChartAnalysisViewSet, basename='chart-analysis')
 router.register(r'indicators', SavedIndicatorViewSet, basename='saved-indicator')
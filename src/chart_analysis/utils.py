@@ -0,0 +1,97 @@
+import time
+from functools import wraps
+from django.core.cache import cache
+from .models import Pair
+
+# Seconds each advanced analytics payload is cached per user
+ANALYTICS_CACHE_TIMEOUTS = {
+    'indicator_performance': 30,
+    'timeframe_performance': 30,
+    'pair_performance': 30,
+    'risk_analysis': 10,
+    'dashboard': 10,
+}
+# Seconds the last good copy of each payload is kept for database outages
+ANALYTICS_STALE_TIMEOUT = 60 * 60
+# Milliseconds an analytics query may run on PostgreSQL before it is cancelled
+ANALYTICS_STATEMENT_TIMEOUT = 2000
+# Seconds each process keeps its copy of the pair table
+PAIRS_CACHE_TIMEOUT = 30
+
+
+def _ttl_cache(seconds):
+    """
+    Cache the result of a function without arguments for `seconds`
+
+    The Pair signal handlers only clear the copy held by the process that
+    saved the pair, so the expiry bounds how long other workers keep
+    serving the old rows.
+    """
+    def decorator(func):
+        state = {}
+
+        @wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            entry = state.get('entry')
+            if entry is None or entry[0] <= now:
+                entry = (now + seconds, func())
+                state['entry'] = entry
+            return entry[1]
+
+        wrapper.cache_clear = state.clear
+        return wrapper
+    return decorator
+
+
+@_ttl_cache(PAIRS_CACHE_TIMEOUT)
+def get_pairs_by_id():
+    """
+    Get the names of every trading pair, keyed by id
+
+    The pair table is small and only changes through the admin or the
+    load_initial_pairs command, so each process re-reads it at most every
+    PAIRS_CACHE_TIMEOUT seconds, and the Pair save/delete signal handlers
+    clear it straight away.
+
+    Returns:
+        dict: {pair_id: (name, display_name)}
+    """
+    return {
+        pair_id: (name, display_name)
+        for pair_id, name, display_name in Pair.objects.values_list(
+            'id', 'name', 'display_name'
+        )
+    }
+
+
+@_ttl_cache(PAIRS_CACHE_TIMEOUT)
+def get_active_pairs():
+    """
+    Get the active trading pairs, re-read every PAIRS_CACHE_TIMEOUT seconds
+    like get_pairs_by_id and cleared by the same Pair save/delete signal
+    handlers
+
+    Returns:
+        tuple: Pair instances ordered by id
+    """
+    return tuple(Pair.objects.filter(is_active=True).order_by('id'))
+
+
+def analytics_cache_key(user_id, name, stale=False):
+    """
+    Cache key for one of a user's advanced analytics payloads, or for its
+    long-lived last known good copy when `stale` is set
+    """
+    if stale:
+        return f"analytics:{user_id}:{name}:stale:v1"
+    return f"analytics:{user_id}:{name}:v1"
+
+
+def clear_analytics_cache(user_id):
+    """
+    Drop every cached advanced analytics payload for a user
+    """
+    cache.delete_many([
+        analytics_cache_key(user_id, name) for name in ANALYTICS_CACHE_TIMEOUTS
+    ])
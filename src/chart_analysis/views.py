@@ -1,11 +1,20 @@
 from django.shortcuts import render
+import json
 import logging
 import random
+from functools import lru_cache
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.db import DatabaseError, connection, transaction
 from django.db.models import Q
-from rest_framework import viewsets, status, permissions
+from rest_framework import viewsets, status, permissions, serializers
 from rest_framework.decorators import action
+from rest_framework.utils.encoders import JSONEncoder
+from core.mixins import ConditionalGetMixin
+from core.renderers import ORJSONRenderer
 from rest_framework.response import Response
+from rest_framework.renderers import BrowsableAPIRenderer
 from subscriptions.middleware import PremiumAccessMiddleware
 from subscriptions.utils import (
     has_active_subscription,
@@ -13,6 +22,7 @@ from subscriptions.utils import (
     is_premium_timeframe
 )
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
 
 from .models import (
     Pair,
@@ -31,6 +41,7 @@ from .models import (
 from .serializers import (
     PairSerializer,
     ChartAnalysisSerializer,
+    ChartAnalysisListSerializer,
     SavedIndicatorSerializer,
     SupportResistanceLevelSerializer,
     IndicatorChoiceSerializer,
@@ -43,17 +54,109 @@ from .serializers import (
     UserIndicatorSettingsSerializer
 )
 from .filters import ChartAnalysisFilter, SavedIndicatorFilter
+from .utils import (
+    ANALYTICS_CACHE_TIMEOUTS, ANALYTICS_STALE_TIMEOUT, ANALYTICS_STATEMENT_TIMEOUT,
+    analytics_cache_key, get_active_pairs
+)
 
 logger = logging.getLogger(__name__)
 
+# Choice payloads are static, so build them once at import time
+INDICATOR_CHOICES = [
+    {'value': value, 'display_name': display_name}
+    for value, display_name in TechnicalIndicator.choices
+]
+TIMEFRAME_CHOICES = [
+    {'value': value, 'display_name': display_name}
+    for value, display_name in Timeframe.choices
+]
+INDICATOR_NAMES = dict(TechnicalIndicator.choices)
+# A tuple, not a set, so membership checks don't hash client input
+PREMIUM_INDICATORS = (
+    TechnicalIndicator.ICHIMOKU,
+    TechnicalIndicator.FIBONACCI
+)
+
+# Indicator settings created for users who haven't configured any
+DEFAULT_INDICATOR_SETTINGS = (
+    {'indicator_type': 'rsi', 'weight': 0.8, 'is_active': True, 
+     'indicator_parameters': {'period': 14, 'overbought': 70, 'oversold': 30}},
+    {'indicator_type': 'macd', 'weight': 0.7, 'is_active': True,
+     'indicator_parameters': {'fast_period': 12, 'slow_period': 26, 'signal_period': 9}},
+    {'indicator_type': 'bollinger', 'weight': 0.6, 'is_active': True,
+     'indicator_parameters': {'period': 20, 'std_dev': 2}},
+    {'indicator_type': 'ma', 'weight': 0.5, 'is_active': True,
+     'indicator_parameters': {'period': 50, 'type': 'SMA'}},
+    {'indicator_type': 'stoch', 'weight': 0.5, 'is_active': True,
+     'indicator_parameters': {'k_period': 14, 'd_period': 3}},
+)
+
+# Rows fetched per round trip when streaming exports
+EXPORT_CHUNK_SIZE = 2000
+
+# Mock analysis inputs, shared across requests
+_rng = random.Random()
+MOCK_BASE_PRICES = {
+    'EUR/USD': 1.08,
+    'BTC/USD': 60000,
+}
+VOLATILITY_LEVELS = ('low', 'moderate', 'high')
+
+# Numeric value of each indicator signal when weighting them together
+SIGNAL_VALUES = {'buy': 1, 'neutral': 0, 'sell': -1}
+
+# Mock indicator value ranges; int bounds draw with randint, float bounds with uniform
+MOCK_SIGNALS = ('buy', 'sell', 'neutral')
+MOCK_INDICATOR_RANGES = {
+    'rsi': (1, 100),
+    'macd': (-2.0, 2.0),
+    'bollinger': (-2.0, 2.0),
+    'ma': (-5.0, 5.0),
+    'stoch': (1, 100),
+    'ema': (-5.0, 5.0),
+    'adx': (1, 100),
+    'ichimoku': (-2.0, 2.0),
+    'fib': (0.0, 1.0),
+}
 
-class PairViewSet(viewsets.ReadOnlyModelViewSet):
+# Formatters for the analyze payload, built once instead of per serializer
+_price_field = serializers.DecimalField(max_digits=12, decimal_places=6)
+_percent_field = serializers.DecimalField(max_digits=10, decimal_places=2)
+_datetime_field = serializers.DateTimeField()
+
+
+def _user_sub_active(request):
+    """
+    Check the user's subscription at most once per request
+    """
+    is_active = getattr(request, '_sub_active', None)
+    if is_active is None:
+        is_active = request._sub_active = has_active_subscription(request.user)
+    return is_active
+
+
+@lru_cache(maxsize=None)
+def _timeframe_choices_for(allowed):
+    """
+    Filter the timeframe choices once per subscription tier's allowed set
+    """
+    return [tf for tf in TIMEFRAME_CHOICES if tf['value'] in allowed]
+
+
+class PairViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for listing trading pairs
     """
     queryset = Pair.objects.filter(is_active=True)
     serializer_class = PairSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    def get_queryset(self):
+        # Listing serves the per-process cached pairs instead of querying
+        if self.action == 'list':
+            return get_active_pairs()
+        return super().get_queryset()
 
 
 class ChartAnalysisViewSet(viewsets.ModelViewSet):
@@ -67,7 +170,16 @@ class ChartAnalysisViewSet(viewsets.ModelViewSet):
         """
         Return chart analyses for the current user only
         """
-        return ChartAnalysis.objects.filter(user=self.request.user)
+        queryset = ChartAnalysis.objects.filter(user=self.request.user)
+        if self.action == 'list':
+            queryset = queryset.defer('analysis_data')
+        return self.get_serializer_class().setup_eager_loading(queryset)
+    
+    def get_serializer_class(self):
+        """Use the lighter serializer without analysis_data for listings"""
+        if self.action == 'list':
+            return ChartAnalysisListSerializer
+        return super().get_serializer_class()
     
     def create(self, request, *args, **kwargs):
         """
@@ -81,13 +193,9 @@ class ChartAnalysisViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Add user to request data
-        data = request.data.copy()
-        data['user'] = request.user.id
-        
-        serializer = self.get_serializer(data=data)
+        serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        serializer.save(user=request.user)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     
     @action(detail=False, methods=['get'])
@@ -122,56 +230,68 @@ class ChartAnalysisViewSet(viewsets.ModelViewSet):
         # Generate mock analysis data
         # In a real implementation, this would call a service to perform the analysis
         analysis = self._generate_mock_analysis(pair, timeframe, request.user)
-        serializer = self.get_serializer(analysis)
         
-        return Response(serializer.data)
+        return Response(self._analysis_payload(analysis, pair))
+    
+    def _analysis_payload(self, analysis, pair):
+        """
+        Build the ChartAnalysisSerializer output for an analysis the server
+        just generated, without running it through the serializer
+        """
+        return {
+            'id': analysis.id,
+            'pair': pair.id,
+            'pair_name': pair.name,
+            'pair_display_name': pair.display_name,
+            'timeframe': analysis.timeframe,
+            'timeframe_display': analysis.get_timeframe_display(),
+            'current_price': _price_field.to_representation(analysis.current_price),
+            'change_24h': _percent_field.to_representation(analysis.change_24h),
+            'high_24h': _price_field.to_representation(analysis.high_24h),
+            'low_24h': _price_field.to_representation(analysis.low_24h),
+            'analysis_data': analysis.analysis_data,
+            'overall_signal': analysis.overall_signal,
+            'overall_signal_display': analysis.get_overall_signal_display(),
+            'volatility_level': analysis.volatility_level,
+            'volatility_level_display': analysis.get_volatility_level_display(),
+            'created': _datetime_field.to_representation(analysis.created),
+            'updated': _datetime_field.to_representation(analysis.updated),
+        }
     
     def _generate_mock_analysis(self, pair, timeframe, user):
         """
         Generate mock chart analysis data for demonstration purposes
         In a real implementation, this would use actual market data and analysis
         """
-        # Check if analysis already exists for this pair/timeframe
-        try:
-            analysis = ChartAnalysis.objects.get(
-                pair=pair,
-                timeframe=timeframe,
-                user=user
-            )
-        except ChartAnalysis.DoesNotExist:
-            # Create a new analysis object
-            analysis = ChartAnalysis(
-                pair=pair,
-                timeframe=timeframe,
-                user=user
-            )
+        uniform = _rng.uniform
+        randint = _rng.randint
         
         # Generate random price data (for demo purposes)
-        if pair.name == 'EUR/USD':
-            base_price = 1.08
-        elif pair.name == 'BTC/USD':
-            base_price = 60000
-        else:
-            base_price = random.uniform(1, 100)
+        base_price = MOCK_BASE_PRICES.get(pair.name)
+        if base_price is None:
+            base_price = uniform(1, 100)
         
         # Set price data
-        analysis.current_price = base_price + random.uniform(-0.05, 0.05)
-        analysis.change_24h = random.uniform(-2.0, 2.0)
-        analysis.high_24h = analysis.current_price * (1 + random.uniform(0.01, 0.05))
-        analysis.low_24h = analysis.current_price * (1 - random.uniform(0.01, 0.05))
+        current_price = base_price + uniform(-0.05, 0.05)
+        defaults = {
+            'current_price': current_price,
+            'change_24h': uniform(-2.0, 2.0),
+            'high_24h': current_price * (1 + uniform(0.01, 0.05)),
+            'low_24h': current_price * (1 - uniform(0.01, 0.05)),
+        }
         
         # Set technical analysis data
-        oscillators_buy = random.randint(0, 7)
-        oscillators_neutral = random.randint(0, 7 - oscillators_buy)
+        oscillators_buy = randint(0, 7)
+        oscillators_neutral = randint(0, 7 - oscillators_buy)
         oscillators_sell = 7 - oscillators_buy - oscillators_neutral
         
-        moving_avgs_buy = random.randint(0, 5)
-        moving_avgs_neutral = random.randint(0, 5 - moving_avgs_buy)
+        moving_avgs_buy = randint(0, 5)
+        moving_avgs_neutral = randint(0, 5 - moving_avgs_buy)
         moving_avgs_sell = 5 - moving_avgs_buy - moving_avgs_neutral
         
-        patterns_count = random.randint(2, 5)
+        patterns_count = randint(2, 5)
         
-        analysis.analysis_data = {
+        defaults['analysis_data'] = {
             'oscillators': {
                 'buy': oscillators_buy,
                 'neutral': oscillators_neutral,
@@ -184,7 +304,7 @@ class ChartAnalysisViewSet(viewsets.ModelViewSet):
             },
             'patterns': {
                 'count': patterns_count,
-                'neutral': random.randint(0, patterns_count)
+                'neutral': randint(0, patterns_count)
             }
         }
         
@@ -193,17 +313,22 @@ class ChartAnalysisViewSet(viewsets.ModelViewSet):
         total_sell = oscillators_sell + moving_avgs_sell
         
         if total_buy > total_sell + 3:
-            analysis.overall_signal = 'buy'
+            defaults['overall_signal'] = 'buy'
         elif total_sell > total_buy + 3:
-            analysis.overall_signal = 'sell'
+            defaults['overall_signal'] = 'sell'
         else:
-            analysis.overall_signal = 'neutral'
+            defaults['overall_signal'] = 'neutral'
         
         # Set volatility
-        volatility_options = ['low', 'moderate', 'high']
-        analysis.volatility_level = random.choice(volatility_options)
-        
-        analysis.save()
+        defaults['volatility_level'] = _rng.choice(VOLATILITY_LEVELS)
+        
+        # One upsert on the (pair, user, timeframe) unique constraint
+        analysis, _ = ChartAnalysis.objects.update_or_create(
+            pair=pair,
+            timeframe=timeframe,
+            user=user,
+            defaults=defaults
+        )
         return analysis
 
 
@@ -218,66 +343,46 @@ class SavedIndicatorViewSet(viewsets.ModelViewSet):
         """
         Return saved indicators for the current user only
         """
-        return SavedIndicator.objects.filter(user=self.request.user)
+        queryset = SavedIndicator.objects.filter(user=self.request.user)
+        return self.get_serializer_class().setup_eager_loading(queryset)
     
     def create(self, request, *args, **kwargs):
         """
         Create a new saved indicator
         """
-        # Check if user has premium access for advanced indicators
-        if not has_active_subscription(request.user):
-            premium_indicators = [
-                TechnicalIndicator.ICHIMOKU,
-                TechnicalIndicator.FIBONACCI
-            ]
-            if request.data.get('indicator_type') in premium_indicators:
-                return Response(
-                    {"detail": "This indicator requires a premium subscription"},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-        
-        # Add user to request data
-        data = request.data.copy()
-        data['user'] = request.user.id
+        # Check premium access only for advanced indicators
+        if (
+            request.data.get('indicator_type') in PREMIUM_INDICATORS
+            and not _user_sub_active(request)
+        ):
+            return Response(
+                {"detail": "This indicator requires a premium subscription"},
+                status=status.HTTP_403_FORBIDDEN
+            )
         
-        serializer = self.get_serializer(data=data)
+        serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        serializer.save(user=request.user)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     
+    @extend_schema(responses=IndicatorChoiceSerializer(many=True))
     @action(detail=False, methods=['get'])
     def available_indicators(self, request):
         """
         Get a list of available indicators based on subscription level
         """
-        indicators = []
-        for indicator in TechnicalIndicator.choices:
-            indicators.append({
-                'value': indicator[0],
-                'display_name': indicator[1]
-            })
-        
-        serializer = IndicatorChoiceSerializer(indicators, many=True)
-        return Response(serializer.data)
+        return Response(INDICATOR_CHOICES)
     
+    @extend_schema(responses=TimeframeChoiceSerializer(many=True))
     @action(detail=False, methods=['get'])
     def available_timeframes(self, request):
         """
         Get a list of available timeframes based on subscription level
         """
         user_limits = get_user_limits(request.user)
-        available_timeframes = user_limits.get('timeframes', [])
-        
-        timeframes = []
-        for tf in Timeframe.choices:
-            if tf[0] in available_timeframes:
-                timeframes.append({
-                    'value': tf[0],
-                    'display_name': tf[1]
-                })
+        available_timeframes = frozenset(user_limits.get('timeframes', ()))
         
-        serializer = TimeframeChoiceSerializer(timeframes, many=True)
-        return Response(serializer.data)
+        return Response(_timeframe_choices_for(available_timeframes))
 
 
 class SupportResistanceViewSet(viewsets.ModelViewSet):
@@ -292,9 +397,10 @@ class SupportResistanceViewSet(viewsets.ModelViewSet):
         Return support/resistance levels created by the current user
         or shared publicly
         """
-        return SupportResistanceLevel.objects.filter(
+        queryset = SupportResistanceLevel.objects.filter(
             Q(created_by=self.request.user)
         )
+        return self.get_serializer_class().setup_eager_loading(queryset)
     
     def create(self, request, *args, **kwargs):
         """
@@ -308,13 +414,9 @@ class SupportResistanceViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Add user to request data
-        data = request.data.copy()
-        data['created_by'] = request.user.id
-        
-        serializer = self.get_serializer(data=data)
+        serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        serializer.save(created_by=request.user)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     
     @action(detail=False, methods=['get'])
@@ -338,12 +440,13 @@ class SupportResistanceViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
+        # Served by the (created_by, pair, timeframe, price_level) index
         levels = SupportResistanceLevel.objects.filter(
+            created_by=self.request.user,
             pair_id=pair_id,
             timeframe=timeframe
-        ).filter(
-            Q(created_by=self.request.user)
         ).order_by('price_level')
+        levels = self.get_serializer_class().setup_eager_loading(levels)
         
         serializer = self.get_serializer(levels, many=True)
         return Response(serializer.data)
@@ -362,34 +465,57 @@ class SignalPerformanceViewSet(viewsets.ModelViewSet):
         """
         Return signal performances for the current user only
         """
-        return SignalPerformance.objects.filter(user=self.request.user)
+        queryset = SignalPerformance.objects.filter(user=self.request.user)
+        return self.get_serializer_class().setup_eager_loading(queryset)
     
     def create(self, request, *args, **kwargs):
         """
         Create a new signal performance record
         """
         # Check if user has premium access
-        if not has_active_subscription(request.user):
+        if not _user_sub_active(request):
             return Response(
                 {"detail": "Signal performance tracking requires a premium subscription"},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Add user to request data
-        data = request.data.copy()
-        data['user'] = request.user.id
-        
-        serializer = self.get_serializer(data=data)
+        serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        serializer.save(user=request.user)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream all signal performances as newline-delimited JSON
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer_class = self.get_serializer_class()
+        # Shared so pair details are serialized once per pair across rows
+        context = self.get_serializer_context()
+        
+        def rows():
+            for obj in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                data = serializer_class(obj, context=context).data
+                yield json.dumps(data, cls=JSONEncoder, separators=(',', ':')) + '\n'
+        
+        return StreamingHttpResponse(rows(), content_type='application/x-ndjson')
 
 
-class AdvancedAnalyticsViewSet(viewsets.ViewSet):
+class AdvancedAnalyticsViewSet(ConditionalGetMixin, viewsets.ViewSet):
     """
     ViewSet for advanced analytics dashboard
     """
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    # Set when a payload had to come from the stale copy
+    served_stale = False
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.served_stale:
+            response['X-Cache'] = 'STALE'
+        return response
     
     @action(detail=False, methods=['get'])
     def indicator_performance(self, request):
@@ -397,14 +523,14 @@ class AdvancedAnalyticsViewSet(viewsets.ViewSet):
         Get performance data for various indicators
         """
         # Check if user has premium access
-        if not has_active_subscription(request.user):
+        if not self._sub_active(request, 'indicator_performance'):
             return Response(
                 {"detail": "Advanced analytics requires a premium subscription"},
                 status=status.HTTP_403_FORBIDDEN
             )
         
         # Get or generate indicator performance data
-        indicators = self._get_indicator_performance(request.user)
+        indicators = self._cached(request.user, 'indicator_performance', self._get_indicator_performance)
         
         return Response(indicators)
     
@@ -414,14 +540,14 @@ class AdvancedAnalyticsViewSet(viewsets.ViewSet):
         Get performance data by timeframe
         """
         # Check if user has premium access
-        if not has_active_subscription(request.user):
+        if not self._sub_active(request, 'timeframe_performance'):
             return Response(
                 {"detail": "Advanced analytics requires a premium subscription"},
                 status=status.HTTP_403_FORBIDDEN
             )
         
         # Get or generate timeframe performance data
-        timeframes = self._get_timeframe_performance(request.user)
+        timeframes = self._cached(request.user, 'timeframe_performance', self._get_timeframe_performance)
         
         return Response(timeframes)
     
@@ -431,14 +557,14 @@ class AdvancedAnalyticsViewSet(viewsets.ViewSet):
         Get performance data by currency pair
         """
         # Check if user has premium access
-        if not has_active_subscription(request.user):
+        if not self._sub_active(request, 'pair_performance'):
             return Response(
                 {"detail": "Advanced analytics requires a premium subscription"},
                 status=status.HTTP_403_FORBIDDEN
             )
         
         # Get or generate pair performance data
-        pairs = self._get_pair_performance(request.user)
+        pairs = self._cached(request.user, 'pair_performance', self._get_pair_performance)
         
         return Response(pairs)
     
@@ -448,14 +574,14 @@ class AdvancedAnalyticsViewSet(viewsets.ViewSet):
         Get risk analysis metrics
         """
         # Check if user has premium access
-        if not has_active_subscription(request.user):
+        if not self._sub_active(request, 'risk_analysis'):
             return Response(
                 {"detail": "Advanced analytics requires a premium subscription"},
                 status=status.HTTP_403_FORBIDDEN
             )
         
         # Get or generate risk analysis data
-        risk_data = self._get_risk_analysis(request.user)
+        risk_data = self._cached(request.user, 'risk_analysis', self._get_risk_analysis)
         
         return Response(risk_data)
     
@@ -465,109 +591,169 @@ class AdvancedAnalyticsViewSet(viewsets.ViewSet):
         Get all advanced analytics data for the dashboard
         """
         # Check if user has premium access
-        if not has_active_subscription(request.user):
+        if not self._sub_active(request, 'dashboard'):
             return Response(
                 {"detail": "Advanced analytics requires a premium subscription"},
                 status=status.HTTP_403_FORBIDDEN
             )
         
         # Combine all analytics for the dashboard
-        dashboard_data = {
-            'indicator_performance': self._get_indicator_performance(request.user),
-            'timeframe_performance': self._get_timeframe_performance(request.user),
-            'pair_performance': self._get_pair_performance(request.user),
-            'risk_analysis': self._get_risk_analysis(request.user)
-        }
+        dashboard_data = self._cached(request.user, 'dashboard', self._get_dashboard)
         
         return Response(dashboard_data)
     
+    def _sub_active(self, request, name):
+        """
+        Check the user's subscription, letting users with a last good copy of
+        the payload through while the database is unavailable
+        """
+        try:
+            return _user_sub_active(request)
+        except DatabaseError:
+            # Only premium users ever had a payload cached for them
+            if cache.get(analytics_cache_key(request.user.id, name, stale=True)) is None:
+                raise
+            logger.warning(f"Subscription check failed for user {request.user.id}", exc_info=True)
+            return True
+    
+    def _cached(self, user, name, build):
+        """
+        Return a user's analytics payload from the cache, building it on a miss
+
+        If the database fails or is too slow while building, the last good
+        payload is served instead of an error, as long as one is still cached
+        """
+        key = analytics_cache_key(user.id, name)
+        data = cache.get(key)
+        if data is not None:
+            return data
+        
+        stale_key = analytics_cache_key(user.id, name, stale=True)
+        try:
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    # Give up on a slow database instead of waiting on it
+                    with connection.cursor() as cursor:
+                        cursor.execute(
+                            "SELECT set_config('statement_timeout', %s, true)",
+                            [str(ANALYTICS_STATEMENT_TIMEOUT)]
+                        )
+                data = build(user)
+        except DatabaseError:
+            data = cache.get(stale_key)
+            if data is None:
+                raise
+            logger.warning(f"Serving stale {name} analytics for user {user.id}", exc_info=True)
+            self.served_stale = True
+            return data
+        
+        # Don't let a payload assembled from stale sections pass as fresh
+        if not self.served_stale:
+            cache.set(key, data, timeout=ANALYTICS_CACHE_TIMEOUTS[name])
+            cache.set(stale_key, data, timeout=ANALYTICS_STALE_TIMEOUT)
+        return data
+    
+    def _get_dashboard(self, user):
+        """
+        Combine every analytics section, reusing any that are already cached
+        """
+        sections = {
+            'indicator_performance': self._get_indicator_performance,
+            'timeframe_performance': self._get_timeframe_performance,
+            'pair_performance': self._get_pair_performance,
+            'risk_analysis': self._get_risk_analysis,
+        }
+        # Look up every cached section in one cache round trip
+        keys = {name: analytics_cache_key(user.id, name) for name in sections}
+        cached = cache.get_many(keys.values())
+        return {
+            name: cached[keys[name]] if keys[name] in cached else self._cached(user, name, build)
+            for name, build in sections.items()
+        }
+    
     def _get_indicator_performance(self, user):
         """
         Get or generate indicator performance data
         """
-        # Check if data exists and return it, otherwise generate mock data
-        indicators = IndicatorPerformance.objects.filter(user=user)
+        # Return stored data if there is any, otherwise generate mock data
+        indicators = IndicatorPerformanceSerializer.values_data(
+            IndicatorPerformance.objects.filter(user=user)
+        )
         
-        if not indicators.exists():
+        if not indicators:
             # Generate mock data for demonstration
-            indicator_data = []
-            for indicator in TechnicalIndicator.choices:
-                accuracy = round(random.uniform(60, 95), 2)
-                indicator_data.append({
-                    'indicator': indicator[0],
-                    'name': indicator[1],
-                    'accuracy': accuracy,
-                    'sample_size': random.randint(50, 300)
-                })
-            return indicator_data
-        
-        # If real data exists, format and return it
-        serializer = IndicatorPerformanceSerializer(indicators, many=True)
-        return serializer.data
+            uniform = _rng.uniform
+            randint = _rng.randint
+            return [
+                {
+                    'indicator': value,
+                    'name': name,
+                    'accuracy': round(uniform(60, 95), 2),
+                    'sample_size': randint(50, 300)
+                }
+                for value, name in TechnicalIndicator.choices
+            ]
+        
+        return indicators
     
     def _get_timeframe_performance(self, user):
         """
         Get or generate timeframe performance data
         """
-        # Check if data exists and return it, otherwise generate mock data
-        timeframes = TimeframePerformance.objects.filter(user=user)
+        # Return stored data if there is any, otherwise generate mock data
+        timeframes = TimeframePerformanceSerializer.values_data(
+            TimeframePerformance.objects.filter(user=user)
+        )
         
-        if not timeframes.exists():
+        if not timeframes:
             # Generate mock data for demonstration
-            timeframe_data = {
+            uniform = _rng.uniform
+            randint = _rng.randint
+            return {
                 'average': 65,
-                'timeframes': []
+                'timeframes': [
+                    {
+                        'timeframe': value,
+                        'name': name,
+                        # Random accuracy between 55% and 85%
+                        'accuracy': round(uniform(55, 85), 2),
+                        'sample_size': randint(30, 200)
+                    }
+                    for value, name in Timeframe.choices
+                ]
             }
-            
-            for tf in Timeframe.choices:
-                # Generate a random accuracy between 55% and 85%
-                accuracy = round(random.uniform(55, 85), 2)
-                timeframe_data['timeframes'].append({
-                    'timeframe': tf[0],
-                    'name': tf[1],
-                    'accuracy': accuracy,
-                    'sample_size': random.randint(30, 200)
-                })
-            
-            return timeframe_data
         
-        # If real data exists, format and return it
-        serializer = TimeframePerformanceSerializer(timeframes, many=True)
-        avg_accuracy = sum(tf.accuracy for tf in timeframes) / timeframes.count()
+        avg_accuracy = sum(tf['accuracy'] for tf in timeframes) / len(timeframes)
         
         return {
             'average': round(avg_accuracy, 2),
-            'timeframes': serializer.data
+            'timeframes': timeframes
         }
     
     def _get_pair_performance(self, user):
         """
         Get or generate pair performance data
         """
-        # Check if data exists and return it, otherwise generate mock data
-        pair_performances = PairPerformance.objects.filter(user=user)
+        # Return stored data if there is any, otherwise generate mock data
+        pair_performances = PairPerformanceSerializer.values_data(
+            PairPerformance.objects.filter(user=user)
+        )
         
-        if not pair_performances.exists():
+        if not pair_performances:
             # Generate mock data for demonstration
-            pair_data = []
-            
-            # Get all active pairs
-            pairs = Pair.objects.filter(is_active=True)
-            
-            for pair in pairs:
-                # Generate a random accuracy between 65% and 85%
-                accuracy = round(random.uniform(65, 85), 2)
-                pair_data.append({
+            uniform = _rng.uniform
+            randint = _rng.randint
+            return [
+                {
                     'pair': pair.name,
-                    'accuracy': accuracy,
-                    'sample_size': random.randint(30, 150)
-                })
-            
-            return pair_data
+                    # Random accuracy between 65% and 85%
+                    'accuracy': round(uniform(65, 85), 2),
+                    'sample_size': randint(30, 150)
+                }
+                for pair in get_active_pairs()
+            ]
         
-        # If real data exists, format and return it
-        serializer = PairPerformanceSerializer(pair_performances, many=True)
-        return serializer.data
+        return pair_performances
     
     def _get_risk_analysis(self, user):
         """
@@ -580,19 +766,21 @@ class AdvancedAnalyticsViewSet(viewsets.ViewSet):
             return serializer.data
         except RiskAnalysis.DoesNotExist:
             # Generate mock data for demonstration
-            win_rate = round(random.uniform(65, 85), 2)
-            avg_rr = round(random.uniform(1.5, 3.0), 2)
-            max_drawdown = round(random.uniform(5, 15), 2)
-            profit_factor = round(random.uniform(1.5, 2.5), 2)
+            uniform = _rng.uniform
+            randint = _rng.randint
+            win_rate = round(uniform(65, 85), 2)
+            avg_rr = round(uniform(1.5, 3.0), 2)
+            max_drawdown = round(uniform(5, 15), 2)
+            profit_factor = round(uniform(1.5, 2.5), 2)
             
             return {
                 'win_rate': win_rate,
                 'avg_risk_reward': f"1:{avg_rr}",
                 'max_drawdown': f"{max_drawdown}%",
                 'profit_factor': profit_factor,
-                'total_trades': random.randint(100, 500),
-                'winning_trades': random.randint(70, 300),
-                'losing_trades': random.randint(30, 200)
+                'total_trades': randint(100, 500),
+                'winning_trades': randint(70, 300),
+                'losing_trades': randint(30, 200)
             }
 
 
@@ -618,30 +806,22 @@ class UserIndicatorSettingsViewSet(viewsets.ModelViewSet):
         Return default indicator settings for a new user.
         Creates default settings if they don't exist.
         """
-        # Default indicator settings
-        default_indicators = [
-            {'indicator_type': 'rsi', 'weight': 0.8, 'is_active': True, 
-             'indicator_parameters': {'period': 14, 'overbought': 70, 'oversold': 30}},
-            {'indicator_type': 'macd', 'weight': 0.7, 'is_active': True,
-             'indicator_parameters': {'fast_period': 12, 'slow_period': 26, 'signal_period': 9}},
-            {'indicator_type': 'bollinger', 'weight': 0.6, 'is_active': True,
-             'indicator_parameters': {'period': 20, 'std_dev': 2}},
-            {'indicator_type': 'ma', 'weight': 0.5, 'is_active': True,
-             'indicator_parameters': {'period': 50, 'type': 'SMA'}},
-            {'indicator_type': 'stoch', 'weight': 0.5, 'is_active': True,
-             'indicator_parameters': {'k_period': 14, 'd_period': 3}},
-        ]
-        
-        # Check if user has any settings
-        user_settings = self.get_queryset()
-        
-        # If user has no settings, create defaults
-        if not user_settings.exists():
-            for setting in default_indicators:
-                UserIndicatorSettings.objects.create(
-                    user=request.user,
-                    **setting
-                )
+        # Fetch the user's settings, which is the only query once they exist
+        user_settings = list(self.get_queryset())
+        
+        # If user has no settings, create the defaults in one INSERT
+        if not user_settings:
+            UserIndicatorSettings.objects.bulk_create(
+                [
+                    UserIndicatorSettings(
+                        user=request.user,
+                        **{**setting, 'indicator_parameters': dict(setting['indicator_parameters'])}
+                    )
+                    for setting in DEFAULT_INDICATOR_SETTINGS
+                ],
+                # A concurrent first request may have created them already
+                ignore_conflicts=True
+            )
             
             # Fetch the newly created settings
             user_settings = self.get_queryset()
@@ -662,36 +842,46 @@ class UserIndicatorSettingsViewSet(viewsets.ModelViewSet):
                 ...
             ]
         }
+        
+        Invalid settings are reported keyed by their id.
         """
         settings_data = request.data.get('settings', [])
-        response_data = []
+        
+        # Load every referenced setting in one query
+        instances = {
+            str(instance.id): instance
+            for instance in self.get_queryset().filter(
+                id__in=[setting.get('id') for setting in settings_data]
+            )
+        }
         
         for setting in settings_data:
-            try:
-                instance = UserIndicatorSettings.objects.get(
-                    id=setting.get('id'), 
-                    user=request.user
-                )
-                serializer = self.get_serializer(
-                    instance, 
-                    data=setting, 
-                    partial=True
-                )
-                if serializer.is_valid():
-                    serializer.save()
-                    response_data.append(serializer.data)
-                else:
-                    return Response(
-                        serializer.errors, 
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-            except UserIndicatorSettings.DoesNotExist:
+            if str(setting.get('id')) not in instances:
                 return Response(
                     {"detail": f"Setting with id {setting.get('id')} not found"},
                     status=status.HTTP_404_NOT_FOUND
                 )
         
-        return Response(response_data)
+        # Validate every change, then write them all with one bulk_update
+        serializer = self.get_serializer(
+            instances, 
+            data=settings_data, 
+            many=True,
+            partial=True
+        )
+        if not serializer.is_valid():
+            # Nothing is written unless every setting is valid
+            return Response(
+                {
+                    str(setting.get('id')): errors
+                    for setting, errors in zip(settings_data, serializer.errors)
+                    if errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        serializer.save()
+        
+        return Response(serializer.data)
 
     @action(detail=False, methods=['post'])
     def generate_signals(self, request):
@@ -741,9 +931,9 @@ class UserIndicatorSettingsViewSet(viewsets.ModelViewSet):
             )
             
         # Get active indicator settings for the user
-        indicator_settings = self.get_queryset().filter(is_active=True)
+        indicator_settings = list(self.get_queryset().filter(is_active=True))
         
-        if not indicator_settings.exists():
+        if not indicator_settings:
             return Response(
                 {"detail": "No active indicators found. Please configure your indicators first."},
                 status=status.HTTP_400_BAD_REQUEST
@@ -766,7 +956,7 @@ class UserIndicatorSettingsViewSet(viewsets.ModelViewSet):
             )
             
             # Convert signal to numeric value: buy=1, neutral=0, sell=-1
-            signal_value = 1 if signal['signal'] == 'buy' else (-1 if signal['signal'] == 'sell' else 0)
+            signal_value = SIGNAL_VALUES[signal['signal']]
             
             # Apply weight
             weight = float(setting.weight)
@@ -775,7 +965,7 @@ class UserIndicatorSettingsViewSet(viewsets.ModelViewSet):
             total_weight += weight
             
             indicator_signals.append({
-                'name': setting.get_indicator_type_display(),
+                'name': INDICATOR_NAMES.get(setting.indicator_type, setting.indicator_type),
                 'signal': signal['signal'],
                 'value': signal['value'],
                 'weight': weight,
@@ -813,47 +1003,15 @@ class UserIndicatorSettingsViewSet(viewsets.ModelViewSet):
         This is a simplified mock implementation. In a real application,
         this would fetch market data and calculate actual indicator values.
         """
-        import random
-        
         # Mock data for demonstration - would be replaced with actual calculations
-        mock_signals = {
-            'rsi': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.randint(1, 100)
-            },
-            'macd': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.uniform(-2, 2)
-            },
-            'bollinger': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.uniform(-2, 2)
-            },
-            'ma': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.uniform(-5, 5)
-            },
-            'stoch': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.randint(1, 100)
-            },
-            'ema': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.uniform(-5, 5)
-            },
-            'adx': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.randint(1, 100)
-            },
-            'ichimoku': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.uniform(-2, 2)
-            },
-            'fib': {
-                'signal': random.choice(['buy', 'sell', 'neutral']),
-                'value': random.uniform(0, 1)
-            }
-        }
-        
-        # Return mock signal for the requested indicator
-        return mock_signals.get(indicator_type, {'signal': 'neutral', 'value': 0})
+        bounds = MOCK_INDICATOR_RANGES.get(indicator_type)
+        if bounds is None:
+            return {'signal': 'neutral', 'value': 0}
+        
+        # Only draw for the requested indicator
+        low, high = bounds
+        if isinstance(low, int):
+            value = _rng.randint(low, high)
+        else:
+            value = _rng.uniform(low, high)
+        return {'signal': _rng.choice(MOCK_SIGNALS), 'value': value}
@@ -0,0 +1,28 @@
+from functools import partial
+
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import get_conditional_response, set_response_etag
+
+
+class ConditionalGetMixin:
+    """
+    Tag successful GET responses with an ETag of the rendered body and answer
+    a matching If-None-Match with 304 Not Modified, so polling clients skip
+    downloading bodies that have not changed
+    """
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if (
+            request.method in ("GET", "HEAD")
+            and response.status_code == 200
+            and isinstance(response, SimpleTemplateResponse)
+        ):
+            # The body only exists once DRF has rendered it
+            response.add_post_render_callback(partial(self._conditional_response, request))
+        return response
+
+    @staticmethod
+    def _conditional_response(request, response):
+        set_response_etag(response)
+        return get_conditional_response(request, etag=response["ETag"], response=response)
@@ -0,0 +1,22 @@
+import orjson
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(renderers.BaseRenderer):
+    """
+    JSON renderer backed by orjson, which encodes the large nested analytics
+    payloads several times faster than the stdlib json used by JSONRenderer
+    """
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # Types orjson does not know natively (Decimal, lazy strings, ...)
+        # fall back to DRF's own encoder
+        return orjson.dumps(data, default=_encoder.default, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.http import FileResponse
+from drf_spectacular.views import SpectacularAPIView
+
+
+class BakedSpectacularAPIView(SpectacularAPIView):
+    """
+    Serve the YAML schema written by `manage.py spectacular --file` when it
+    exists, instead of introspecting every view on each request
+    """
+
+    def _get_schema_response(self, request):
+        schema_file = settings.SPECTACULAR_SCHEMA_FILE
+        renderer, _ = self.perform_content_negotiation(request, force=True)
+        # JSON, version or language requests still go through the generator
+        extra_params = set(request.query_params) - {"format"}
+        if renderer.format != "yaml" or extra_params or not schema_file.is_file():
+            return super()._get_schema_response(request)
+        return FileResponse(schema_file.open("rb"), content_type=renderer.media_type)
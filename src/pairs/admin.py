@@ -20,6 +20,7 @@ class DetectedPatternAdmin(admin.ModelAdmin):
         'status', 'pattern_type__category', 'pattern_type__is_bullish', 
         'timeframe', 'pair', 'user'
     ]
+    list_select_related = ('pattern_type', 'pair')
     search_fields = ['pattern_type__name', 'pair__name', 'description']
     readonly_fields = ['detection_time', 'risk_reward_ratio']
     date_hierarchy = 'detection_time'
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class PairsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "pairs" 
\ No newline at end of file
+    name = "pairs" 
+
+    def ready(self):
+        from . import signals  # noqa: F401
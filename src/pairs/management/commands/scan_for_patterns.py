@@ -1,7 +1,12 @@
 import logging
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 from decimal import Decimal
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
+from django.db import connection
 from django.utils import timezone
 from signals.models import TradingPair
 from pairs.models import TimeFrame, PatternCategory
@@ -9,6 +14,29 @@ from pairs.services import PatternRecognitionService
 
 logger = logging.getLogger(__name__)
 
+CANDLE_INTERVAL = timedelta(hours=1)
+
+# Bar length of each timeframe; fetched history is reused until the bar closes
+TIMEFRAME_SECONDS = {
+    TimeFrame.M1: 60,
+    TimeFrame.M5: 5 * 60,
+    TimeFrame.M15: 15 * 60,
+    TimeFrame.M30: 30 * 60,
+    TimeFrame.H1: 60 * 60,
+    TimeFrame.H4: 4 * 60 * 60,
+    TimeFrame.D1: 24 * 60 * 60,
+    TimeFrame.W1: 7 * 24 * 60 * 60,
+    TimeFrame.MN: 30 * 24 * 60 * 60,
+}
+
+# Pair/timeframe scans run concurrently; each one waits mostly on the database
+DEFAULT_WORKERS = 4
+PAIR_CHUNK_SIZE = 500
+
+# Accepted --timeframe and --category values
+_TIMEFRAME_VALUES = frozenset(TimeFrame.values)
+_CATEGORY_VALUES = frozenset(PatternCategory.values)
+
 
 class Command(BaseCommand):
     help = 'Scan for chart patterns on trading pairs'
@@ -29,31 +57,42 @@ class Command(BaseCommand):
             type=str,
             help='Only scan for a specific pattern category (technical, harmonic, candlestick)'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help=f'Number of pair/timeframe scans to run at once (default {DEFAULT_WORKERS})'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Seed the mock data and scores so repeated scans produce the same patterns'
+        )
     
     def handle(self, *args, **options):
         pair_name = options.get('pair')
         timeframe = options.get('timeframe')
         category = options.get('category')
+        workers = max(1, options.get('workers') or 1)
+        seed = options.get('seed')
         
         # Get pairs to scan
         if pair_name:
             try:
-                pairs = [TradingPair.objects.get(name=pair_name)]
+                pair_chunks = [[TradingPair.objects.get(name=pair_name)]]
                 self.stdout.write(f"Scanning single pair: {pair_name}")
             except TradingPair.DoesNotExist:
                 self.stderr.write(f"Trading pair '{pair_name}' not found")
                 return
         else:
-            # Only get active pairs
-            pairs = TradingPair.objects.filter(is_active=True)
-            self.stdout.write(f"Scanning {pairs.count()} trading pairs")
+            pair_chunks = self._active_pair_chunks()
+            self.stdout.write("Scanning active trading pairs")
         
         # Get timeframes to scan
         if timeframe:
             # Validate timeframe format
-            valid_timeframes = [tf[0] for tf in TimeFrame.choices]
-            if timeframe not in valid_timeframes:
-                self.stderr.write(f"Invalid timeframe: {timeframe}. Valid timeframes: {', '.join(valid_timeframes)}")
+            if timeframe not in _TIMEFRAME_VALUES:
+                self.stderr.write(f"Invalid timeframe: {timeframe}. Valid timeframes: {', '.join(TimeFrame.values)}")
                 return
             timeframes = [timeframe]
         else:
@@ -63,52 +102,107 @@ class Command(BaseCommand):
         # Handle category filter
         if category:
             category = category.upper()
-            if category not in [cat.value for cat in PatternCategory]:
-                self.stderr.write(f"Invalid category: {category}. Valid categories: {', '.join([cat.value for cat in PatternCategory])}")
+            if category not in _CATEGORY_VALUES:
+                self.stderr.write(f"Invalid category: {category}. Valid categories: {', '.join(PatternCategory.values)}")
                 return
         
         # Track statistics
         patterns_detected = 0
         pairs_processed = 0
         
-        # Process each pair
-        for pair in pairs:
-            pairs_processed += 1
-            
-            # Process each timeframe
-            for tf in timeframes:
-                # Create pattern recognition service
-                service = PatternRecognitionService(pair, tf)
+        # Scan every pair/timeframe combination across the worker pool, one
+        # chunk of pairs at a time so pending scans stay bounded
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for pairs in pair_chunks:
+                pairs_processed += len(pairs)
+                futures = [
+                    executor.submit(self._scan, pair, tf, category, seed)
+                    for pair in pairs
+                    for tf in timeframes
+                ]
                 
-                # Generate mock historical data for demonstration purposes
-                # In a real implementation, this would fetch data from an API or database
-                historical_data = self._generate_mock_data(pair.name)
-                
-                # Detect patterns
-                if category:
-                    # If category specified, only get patterns of that category
-                    patterns = service.detect_patterns(historical_data)
-                    patterns = [p for p in patterns if p.pattern_type.category == category]
-                else:
-                    patterns = service.detect_patterns(historical_data)
-                
-                # Save detected patterns
-                saved_patterns = service.save_detected_patterns(patterns)
-                patterns_detected += len(saved_patterns)
-                
-                self.stdout.write(f"Detected {len(saved_patterns)} patterns for {pair.name} on {tf} timeframe")
+                for future in as_completed(futures):
+                    pair, tf, saved_count = future.result()
+                    patterns_detected += saved_count
+                    
+                    self.stdout.write(f"Detected {saved_count} patterns for {pair.name} on {tf} timeframe")
         
         self.stdout.write(self.style.SUCCESS(
             f"Pattern scan complete. Processed {pairs_processed} pairs and detected {patterns_detected} patterns."
         ))
     
-    def _generate_mock_data(self, pair_name, candles=100):
+    def _active_pair_chunks(self):
+        """
+        Yield the active pairs in lists of PAIR_CHUNK_SIZE, paging by id so no
+        cursor stays open while a chunk is being scanned
+        """
+        # The scan only needs each pair's id and name
+        pairs = TradingPair.objects.filter(is_active=True).only('id', 'name').order_by('id')
+        last_id = None
+        while True:
+            chunk = pairs if last_id is None else pairs.filter(id__gt=last_id)
+            chunk = list(chunk[:PAIR_CHUNK_SIZE])
+            if not chunk:
+                return
+            yield chunk
+            last_id = chunk[-1].id
+    
+    def _scan(self, pair, tf, category, seed=None):
+        """
+        Detect and save patterns for one pair and timeframe.
+        
+        Runs on a worker thread, so the thread's database connection is
+        closed once the scan is done.
+        
+        Returns:
+            tuple: (pair, timeframe, number of saved patterns)
+        """
+        try:
+            # Create pattern recognition service, seeded alongside the data
+            rng = None if seed is None else random.Random(f"{seed}:{pair.name}:{tf}:scores")
+            service = PatternRecognitionService(pair, tf, rng=rng)
+            
+            historical_data = self._get_historical_data(pair.name, tf, seed)
+            
+            # Detect patterns, only checking the requested category if one was given
+            patterns = service.detect_patterns(historical_data, category=category)
+            
+            # Save detected patterns
+            saved_patterns = service.save_detected_patterns(patterns)
+            return pair, tf, len(saved_patterns)
+        finally:
+            connection.close()
+    
+    def _get_historical_data(self, pair_name, tf, seed=None):
+        """
+        Get OHLCV history for a pair and timeframe.
+        
+        History only changes when a bar closes, so it is cached until the end
+        of the current bar and repeated scans within it reuse the same candles.
+        Seeded runs skip the cache so they always get their own series.
+        """
+        # Generate mock historical data for demonstration purposes
+        # In a real implementation, this would fetch data from an API or database
+        if seed is not None:
+            return self._generate_mock_data(pair_name, seed=f"{seed}:{pair_name}:{tf}")
+        
+        bar_seconds = TIMEFRAME_SECONDS[tf]
+        now = int(time.time())
+        bar_start = now - now % bar_seconds
+        return cache.get_or_set(
+            f"pattern_scan:history:{pair_name}:{tf}:{bar_start}",
+            lambda: self._generate_mock_data(pair_name),
+            timeout=bar_start + bar_seconds - now
+        )
+    
+    def _generate_mock_data(self, pair_name, candles=100, seed=None):
         """
         Generate mock OHLCV data for testing pattern detection.
         
         Args:
             pair_name: Name of the pair to generate data for
             candles: Number of candles to generate
+            seed: Seed for this series' RNG (optional, random when omitted)
             
         Returns:
             list: List of dictionaries with OHLCV data
@@ -137,32 +231,37 @@ class Command(BaseCommand):
         
         # Generate price data with some randomness but also a trend
         current_price = base_price
+        # Each series gets its own RNG so worker threads don't share state
+        rng = random.Random(seed)
+        uniform = rng.uniform
+        half_volatility = volatility * 0.5
         
         # Use a slight uptrend or downtrend
-        trend = random.choice([-1, 1]) * volatility * 0.01
+        trend = rng.choice([-1, 1]) * volatility * 0.01
+        
+        # Timestamps step forward one interval per candle up to "now"
+        timestamp = timezone.now() - CANDLE_INTERVAL * candles
         
-        for i in range(candles):
+        for _ in range(candles):
             # Add some randomness to the price
-            price_change = random.uniform(-volatility, volatility) + trend
-            current_price += price_change
+            current_price += uniform(-volatility, volatility) + trend
             
             # Ensure price is positive
-            current_price = max(current_price, volatility)
+            if current_price < volatility:
+                current_price = volatility
             
-            # Generate OHLCV data
-            candle = {
-                'timestamp': (timezone.now() - timezone.timedelta(hours=candles-i)).isoformat(),
-                'open': current_price - random.uniform(-volatility*0.5, volatility*0.5),
-                'high': current_price + random.uniform(0, volatility),
-                'low': current_price - random.uniform(0, volatility),
+            # Generate OHLCV data, keeping high >= open, close >= low
+            open_price = current_price - uniform(-half_volatility, half_volatility)
+            high = current_price + uniform(0, volatility)
+            low = current_price - uniform(0, volatility)
+            data.append({
+                'timestamp': timestamp,
+                'open': open_price,
+                'high': max(high, open_price, current_price),
+                'low': min(low, open_price, current_price),
                 'close': current_price,
-                'volume': random.uniform(100, 1000)
-            }
-            
-            # Ensure high >= open >= close >= low
-            candle['high'] = max(candle['high'], candle['open'], candle['close'])
-            candle['low'] = min(candle['low'], candle['open'], candle['close'])
-            
-            data.append(candle)
+                'volume': uniform(100, 1000)
+            })
+            timestamp += CANDLE_INTERVAL
         
         return data 
\ No newline at end of file
@@ -0,0 +1,69 @@
+# Generated by Django 5.0.7 on 2026-10-15 07:58
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('signals', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PatternType',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Name')),
+                ('category', models.CharField(choices=[('TECHNICAL', 'Technical'), ('HARMONIC', 'Harmonic'), ('CANDLESTICK', 'Candlestick')], max_length=20, verbose_name='Category')),
+                ('description', models.TextField(blank=True, verbose_name='Description')),
+                ('is_bullish', models.BooleanField(default=True, verbose_name='Bullish')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Pattern Type',
+                'verbose_name_plural': 'Pattern Types',
+                'ordering': ['category', 'name'],
+                'unique_together': {('name', 'category')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DetectedPattern',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timeframe', models.CharField(choices=[('1m', '1 Minute'), ('5m', '5 Minutes'), ('15m', '15 Minutes'), ('30m', '30 Minutes'), ('1h', '1 Hour'), ('4h', '4 Hours'), ('1d', '1 Day'), ('1w', '1 Week'), ('1M', '1 Month')], default='1h', max_length=3, verbose_name='Timeframe')),
+                ('status', models.CharField(choices=[('FORMING', 'Forming'), ('COMPLETE', 'Complete'), ('FAILED', 'Failed'), ('TARGET_HIT', 'Target Hit')], default='FORMING', max_length=10, verbose_name='Status')),
+                ('confidence', models.DecimalField(decimal_places=2, max_digits=5, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(100)], verbose_name='Confidence (%)')),
+                ('price_at_detection', models.DecimalField(decimal_places=8, max_digits=20, verbose_name='Price at Detection')),
+                ('entry_zone_low', models.DecimalField(blank=True, decimal_places=8, max_digits=20, null=True, verbose_name='Entry Zone Low')),
+                ('entry_zone_high', models.DecimalField(blank=True, decimal_places=8, max_digits=20, null=True, verbose_name='Entry Zone High')),
+                ('stop_loss', models.DecimalField(blank=True, decimal_places=8, max_digits=20, null=True, verbose_name='Stop Loss')),
+                ('target_price', models.DecimalField(blank=True, decimal_places=8, max_digits=20, null=True, verbose_name='Target Price')),
+                ('secondary_target', models.DecimalField(blank=True, decimal_places=8, max_digits=20, null=True, verbose_name='Secondary Target')),
+                ('pattern_start_time', models.DateTimeField(verbose_name='Pattern Start Time')),
+                ('detection_time', models.DateTimeField(auto_now_add=True, verbose_name='Detection Time')),
+                ('completion_time', models.DateTimeField(blank=True, null=True, verbose_name='Completion Time')),
+                ('description', models.TextField(blank=True, verbose_name='Pattern Description')),
+                ('completion_percentage', models.DecimalField(decimal_places=2, default=0, max_digits=5, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)], verbose_name='Completion Percentage')),
+                ('chart_image', models.URLField(blank=True, null=True, verbose_name='Chart Image URL')),
+                ('ratios', models.JSONField(blank=True, default=dict, help_text='Stores Fibonacci ratio values for harmonic patterns', verbose_name='Fibonacci Ratios')),
+                ('metadata', models.JSONField(blank=True, default=dict, verbose_name='Metadata')),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='detected_patterns', to='signals.tradingpair', verbose_name='Trading Pair')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='detected_patterns', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('pattern_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='detections', to='pairs.patterntype', verbose_name='Pattern Type')),
+            ],
+            options={
+                'verbose_name': 'Detected Pattern',
+                'verbose_name_plural': 'Detected Patterns',
+                'ordering': ['-detection_time'],
+            },
+        ),
+    ]
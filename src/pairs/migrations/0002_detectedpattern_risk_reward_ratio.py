@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-15 08:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pairs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='detectedpattern',
+            name='risk_reward_ratio',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, help_text='Computed from the entry zone, stop loss and target on save', max_digits=5, null=True, verbose_name='Risk/Reward Ratio'),
+        ),
+    ]
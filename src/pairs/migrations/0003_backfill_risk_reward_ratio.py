@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+MAX_RISK_REWARD_RATIO = Decimal('999.99')
+
+
+def risk_reward_ratio(pattern):
+    """
+    Frozen copy of DetectedPattern.calculate_risk_reward_ratio, since
+    historical models don't carry model methods
+    """
+    if not (pattern.entry_zone_low and pattern.stop_loss and pattern.target_price):
+        return None
+
+    if pattern.entry_zone_high:
+        entry = (pattern.entry_zone_low + pattern.entry_zone_high) / 2
+    else:
+        entry = pattern.entry_zone_low
+
+    if pattern.pattern_type.is_bullish:
+        risk = entry - pattern.stop_loss
+        reward = pattern.target_price - entry
+    else:
+        risk = pattern.stop_loss - entry
+        reward = entry - pattern.target_price
+
+    if risk == 0:
+        return None
+
+    ratio = round(reward / risk, 2)
+    if abs(ratio) > MAX_RISK_REWARD_RATIO:
+        return None
+    return ratio
+
+
+def backfill_risk_reward_ratio(apps, schema_editor):
+    DetectedPattern = apps.get_model('pairs', 'DetectedPattern')
+    patterns = DetectedPattern.objects.filter(
+        entry_zone_low__isnull=False,
+        stop_loss__isnull=False,
+        target_price__isnull=False,
+    ).select_related('pattern_type').only(
+        'entry_zone_low', 'entry_zone_high', 'stop_loss', 'target_price',
+        'pattern_type__is_bullish',
+    ).order_by('pk')
+
+    batch = []
+    for pattern in patterns.iterator(chunk_size=BATCH_SIZE):
+        pattern.risk_reward_ratio = risk_reward_ratio(pattern)
+        if pattern.risk_reward_ratio is not None:
+            batch.append(pattern)
+        if len(batch) >= BATCH_SIZE:
+            DetectedPattern.objects.bulk_update(batch, ['risk_reward_ratio'])
+            batch = []
+    DetectedPattern.objects.bulk_update(batch, ['risk_reward_ratio'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pairs', '0002_detectedpattern_risk_reward_ratio'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_risk_reward_ratio, migrations.RunPython.noop),
+    ]
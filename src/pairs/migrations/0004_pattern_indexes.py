@@ -0,0 +1,48 @@
+# Generated by Django 5.0.7 on 2026-10-15 08:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pairs', '0003_backfill_risk_reward_ratio'),
+        ('signals', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='detectedpattern',
+            index=models.Index(fields=['-detection_time'], name='pairs_detec_detecti_f4fd94_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectedpattern',
+            index=models.Index(fields=['pair', 'timeframe', '-detection_time'], name='pairs_detec_pair_id_e3d22e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectedpattern',
+            index=models.Index(fields=['status', '-detection_time'], name='pairs_detec_status_0c6af1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectedpattern',
+            index=models.Index(fields=['user', '-detection_time'], name='pairs_detec_user_id_f11cef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectedpattern',
+            index=models.Index(fields=['pattern_type', '-detection_time'], name='pairs_detec_pattern_49d362_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectedpattern',
+            index=models.Index(fields=['status', '-completion_time'], name='pairs_detec_status_21e69c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectedpattern',
+            index=models.Index(condition=models.Q(('status__in', ['FORMING', 'COMPLETE'])), fields=['-confidence', '-detection_time'], name='pairs_pattern_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patterntype',
+            index=models.Index(fields=['category', 'is_active'], name='pairs_patte_categor_da3797_idx'),
+        ),
+    ]
@@ -1,4 +1,8 @@
+from datetime import timedelta
+from decimal import Decimal
+
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -6,6 +10,34 @@ from signals.models import TradingPair
 
 User = get_user_model()
 
+_MIN = timedelta(minutes=1)
+_HOUR = timedelta(hours=1)
+_DAY = timedelta(days=1)
+
+# Largest risk/reward ratio the stored column and the API field can hold
+MAX_RISK_REWARD_RATIO = Decimal('999.99')
+
+
+def format_time_since(detection_time, now=None):
+    """
+    Format the time elapsed since detection_time as a string (e.g., '3h ago')
+    
+    Listings pass a single `now` so every row is measured from the same moment.
+    """
+    if not detection_time:
+        return None
+    
+    diff = (now or timezone.now()) - detection_time
+    
+    if diff < _MIN:
+        return "just now"
+    elif diff < _HOUR:
+        return f"{diff // _MIN}m ago"
+    elif diff < _DAY:
+        return f"{diff // _HOUR}h ago"
+    else:
+        return f"{diff.days}d ago"
+
 
 class PatternCategory(models.TextChoices):
     TECHNICAL = "TECHNICAL", _("Technical")
@@ -13,6 +45,10 @@ class PatternCategory(models.TextChoices):
     CANDLESTICK = "CANDLESTICK", _("Candlestick")
 
 
+# Category labels for display, instead of rebuilding the choices dict per call
+_CATEGORY_LABELS = dict(PatternCategory.choices)
+
+
 class PatternType(models.Model):
     """
     Defines a specific chart pattern type (e.g., Double Bottom, Head and Shoulders)
@@ -34,10 +70,14 @@ class PatternType(models.Model):
         verbose_name_plural = _("Pattern Types")
         unique_together = [['name', 'category']]
         ordering = ["category", "name"]
+        indexes = [
+            models.Index(fields=['category', 'is_active']),
+        ]
     
     def __str__(self):
         direction = "Bullish" if self.is_bullish else "Bearish"
-        return f"{direction} {self.name} ({self.get_category_display()})"
+        category = _CATEGORY_LABELS.get(self.category, self.category)
+        return f"{direction} {self.name} ({category})"
 
 
 class TimeFrame(models.TextChoices):
@@ -153,6 +193,15 @@ class DetectedPattern(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(100)]
     )
     chart_image = models.URLField(_("Chart Image URL"), blank=True, null=True)
+    risk_reward_ratio = models.DecimalField(
+        _("Risk/Reward Ratio"),
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=_("Computed from the entry zone, stop loss and target on save")
+    )
     
     # For harmonic patterns
     ratios = models.JSONField(
@@ -169,10 +218,31 @@ class DetectedPattern(models.Model):
         verbose_name = _("Detected Pattern")
         verbose_name_plural = _("Detected Patterns")
         ordering = ["-detection_time"]
+        indexes = [
+            models.Index(fields=['-detection_time']),
+            models.Index(fields=['pair', 'timeframe', '-detection_time']),
+            models.Index(fields=['status', '-detection_time']),
+            models.Index(fields=['user', '-detection_time']),
+            models.Index(fields=['pattern_type', '-detection_time']),
+            models.Index(fields=['status', '-completion_time']),
+            # Active pattern listings rank forming and complete patterns by confidence
+            models.Index(
+                fields=['-confidence', '-detection_time'],
+                condition=models.Q(status__in=[PatternStatus.FORMING, PatternStatus.COMPLETE]),
+                name='pairs_pattern_active_idx'
+            ),
+        ]
         
     def __str__(self):
         return f"{self.pattern_type.name} on {self.pair.name} ({self.timeframe}) - {self.get_status_display()}"
     
+    def save(self, *args, **kwargs):
+        self.risk_reward_ratio = self.calculate_risk_reward_ratio()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'risk_reward_ratio'}
+        super().save(*args, **kwargs)
+    
     @property
     def is_bullish(self):
         return self.pattern_type.is_bullish
@@ -184,29 +254,9 @@ class DetectedPattern(models.Model):
     @property
     def time_since_detection(self):
         """Returns time since detection as a string (e.g., '3h ago')"""
-        if not self.detection_time:
-            return None
-            
-        from django.utils import timezone
-        from datetime import timedelta
-        
-        now = timezone.now()
-        diff = now - self.detection_time
-        
-        if diff < timedelta(minutes=1):
-            return "just now"
-        elif diff < timedelta(hours=1):
-            minutes = int(diff.total_seconds() / 60)
-            return f"{minutes}m ago"
-        elif diff < timedelta(days=1):
-            hours = int(diff.total_seconds() / 3600)
-            return f"{hours}h ago"
-        else:
-            days = diff.days
-            return f"{days}d ago"
+        return format_time_since(self.detection_time)
     
-    @property
-    def risk_reward_ratio(self):
+    def calculate_risk_reward_ratio(self):
         """Calculate risk-reward ratio based on entry, stop loss and target"""
         if not (self.entry_zone_low and self.stop_loss and self.target_price):
             return None
@@ -229,4 +279,8 @@ class DetectedPattern(models.Model):
         if risk == 0:
             return None
             
-        return round(reward / risk, 2) 
\ No newline at end of file
+        # A stop loss right at the entry gives a ratio too large to store
+        ratio = round(reward / risk, 2)
+        if abs(ratio) > MAX_RISK_REWARD_RATIO:
+            return None
+        return ratio 
\ No newline at end of file
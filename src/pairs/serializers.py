@@ -1,7 +1,11 @@
+from django.utils import timezone
 from rest_framework import serializers
-from .models import PatternType, DetectedPattern
+from .models import PatternType, DetectedPattern, format_time_since
 from signals.serializers import TradingPairSerializer
 
+# Formats confidence and completion percentage like their model serializer fields
+_percent_field = serializers.DecimalField(max_digits=5, decimal_places=2)
+
 
 class PatternTypeSerializer(serializers.ModelSerializer):
     category_display = serializers.CharField(source='get_category_display', read_only=True)
@@ -53,4 +57,39 @@ class PatternSummarySerializer(serializers.ModelSerializer):
             'id', 'pattern_name', 'pair_name', 'timeframe', 'status',
             'confidence', 'completion_percentage', 'is_bullish',
             'time_since_detection'
+        ]
+    
+    # Columns read by values_data
+    values_columns = (
+        'id', 'pattern_type__name', 'pair__name', 'timeframe', 'status',
+        'confidence', 'completion_percentage', 'pattern_type__is_bullish',
+        'detection_time'
+    )
+    
+    @classmethod
+    def values_rows(cls, queryset, *extra):
+        """Select the columns values_data needs, plus any extra ones"""
+        return queryset.values(*cls.values_columns, *extra)
+    
+    @classmethod
+    def values_data(cls, rows):
+        """
+        Build the same output as `PatternSummarySerializer(queryset, many=True).data`
+        from values_rows() rows, skipping the per-row field pipeline
+        """
+        now = timezone.now()
+        percent = _percent_field.to_representation
+        return [
+            {
+                'id': row['id'],
+                'pattern_name': row['pattern_type__name'],
+                'pair_name': row['pair__name'],
+                'timeframe': row['timeframe'],
+                'status': row['status'],
+                'confidence': percent(row['confidence']),
+                'completion_percentage': percent(row['completion_percentage']),
+                'is_bullish': row['pattern_type__is_bullish'],
+                'time_since_detection': format_time_since(row['detection_time'], now),
+            }
+            for row in rows
         ] 
\ No newline at end of file
@@ -1,18 +1,48 @@
 import logging
+import random
+from datetime import timedelta
 from decimal import Decimal
 from django.utils import timezone
-from .models import PatternType, DetectedPattern, PatternCategory, PatternStatus, TimeFrame
+from .models import DetectedPattern, PatternCategory, PatternStatus, TimeFrame
+from .utils import get_active_pattern_types
 from signals.models import TradingPair
 
 logger = logging.getLogger(__name__)
 
+# Detected patterns inserted per INSERT statement
+SAVE_BATCH_SIZE = 500
+
+# Entry zone low/high, stop loss, target and secondary target as multiples of
+# the current price. Each target and stop builds on the level before it
+BULLISH_LEVELS = (
+    Decimal('0.99'),
+    Decimal('1.01'),
+    Decimal('0.99') * Decimal('0.97'),
+    Decimal('1.01') * Decimal('1.05'),
+    Decimal('1.01') * Decimal('1.05') * Decimal('1.02'),
+)
+BEARISH_LEVELS = (
+    Decimal('0.99'),
+    Decimal('1.01'),
+    Decimal('1.01') * Decimal('1.03'),
+    Decimal('0.99') * Decimal('0.95'),
+    Decimal('0.99') * Decimal('0.95') * Decimal('0.98'),
+)
+COMPLETION_RATIO = Decimal('0.9')
+CANDLESTICK_CONFIDENCE_BOOST = Decimal('1.1')
+MAX_CANDLESTICK_CONFIDENCE = Decimal('95')
+PATTERN_LOOKBACK = timedelta(hours=24)
+
+# Shared RNG for mock confidence scores when the caller doesn't pass one
+_rng = random.Random()
+
 
 class PatternRecognitionService:
     """
     Service to recognize and analyze chart patterns.
     """
     
-    def __init__(self, pair, timeframe=TimeFrame.H1, user=None):
+    def __init__(self, pair, timeframe=TimeFrame.H1, user=None, rng=None):
         """
         Initialize the service with a trading pair and timeframe.
         
@@ -20,18 +50,21 @@ class PatternRecognitionService:
             pair: TradingPair instance
             timeframe: TimeFrame choice
             user: User instance (optional)
+            rng: random.Random used for mock scores (optional, shared when omitted)
         """
         self.pair = pair
         self.timeframe = timeframe
         self.user = user
+        self.rng = rng or _rng
     
-    def detect_patterns(self, historical_data, patterns_to_check=None):
+    def detect_patterns(self, historical_data, patterns_to_check=None, category=None):
         """
         Detect patterns in the provided historical data.
         
         Args:
             historical_data: List of OHLCV data points for the pair
             patterns_to_check: List of pattern names to check (optional)
+            category: Only check pattern types in this PatternCategory (optional)
             
         Returns:
             list: Detected patterns
@@ -39,75 +72,89 @@ class PatternRecognitionService:
         detected_patterns = []
         
         # Get active pattern types to check
+        pattern_types = get_active_pattern_types()
         if patterns_to_check:
-            pattern_types = PatternType.objects.filter(
-                name__in=patterns_to_check,
-                is_active=True
-            )
-        else:
-            pattern_types = PatternType.objects.filter(is_active=True)
+            names = set(patterns_to_check)
+            pattern_types = [p for p in pattern_types if p.name in names]
+        if category:
+            pattern_types = [p for p in pattern_types if p.category == category]
+            
+        detectors = {
+            PatternCategory.TECHNICAL: self._detect_technical_pattern,
+            PatternCategory.HARMONIC: self._detect_harmonic_pattern,
+            PatternCategory.CANDLESTICK: self._detect_candlestick_pattern,
+        }
+        
+        # Price levels only depend on the data and direction, so work them out
+        # once for every pattern type checked
+        snapshot = self._market_snapshot(historical_data)
             
         # Check each pattern type
         for pattern_type in pattern_types:
             # Call the appropriate detection method based on category
-            if pattern_type.category == PatternCategory.TECHNICAL:
-                pattern = self._detect_technical_pattern(historical_data, pattern_type)
-            elif pattern_type.category == PatternCategory.HARMONIC:
-                pattern = self._detect_harmonic_pattern(historical_data, pattern_type)
-            elif pattern_type.category == PatternCategory.CANDLESTICK:
-                pattern = self._detect_candlestick_pattern(historical_data, pattern_type)
-            else:
+            detector = detectors.get(pattern_type.category)
+            if detector is None:
                 continue
+            pattern = detector(historical_data, pattern_type, snapshot)
                 
             if pattern:
                 detected_patterns.append(pattern)
                 
         return detected_patterns
     
-    def _detect_technical_pattern(self, data, pattern_type):
+    def _market_snapshot(self, data):
+        """
+        Work out the values shared by every pattern detected on the same data.
+        
+        Args:
+            data: OHLCV data
+            
+        Returns:
+            dict: Current price, pattern start time and the mock entry zone,
+            stop loss and target prices keyed by is_bullish
+        """
+        # Get the last candle's close price
+        current_price = Decimal(str(data[-1]['close']))
+        
+        return {
+            'current_price': current_price,
+            'pattern_start_time': timezone.now() - PATTERN_LOOKBACK,
+            'levels': {
+                True: tuple(current_price * multiple for multiple in BULLISH_LEVELS),
+                False: tuple(current_price * multiple for multiple in BEARISH_LEVELS),
+            },
+        }
+    
+    def _detect_technical_pattern(self, data, pattern_type, snapshot=None):
         """
         Detect technical patterns in historical data.
         
         Args:
             data: OHLCV data
             pattern_type: PatternType instance
+            snapshot: Result of _market_snapshot for data (optional)
             
         Returns:
             DetectedPattern or None
         """
         # In a real implementation, this would use complex algorithms to detect patterns
         # For demonstration purposes, we're using very simplified mock logic
-        
-        pattern_name = pattern_type.name.lower()
-        
-        # Get the last candle's close price
-        current_price = Decimal(str(data[-1]['close']))
+        if snapshot is None:
+            snapshot = self._market_snapshot(data)
         
         # Calculate a mock confidence score (between 65 and 95)
-        import random
-        confidence = Decimal(str(random.uniform(65, 95)))
+        confidence = Decimal(str(self.rng.uniform(65, 95)))
         
         # Create a basic description
         description = pattern_type.description
         
-        # Generate mock entry zone, stop loss and target prices
-        if pattern_type.is_bullish:
-            # For bullish patterns
-            entry_zone_low = current_price * Decimal('0.99')
-            entry_zone_high = current_price * Decimal('1.01')
-            stop_loss = entry_zone_low * Decimal('0.97')
-            target_price = entry_zone_high * Decimal('1.05')
-            secondary_target = target_price * Decimal('1.02')
-        else:
-            # For bearish patterns
-            entry_zone_low = current_price * Decimal('0.99')
-            entry_zone_high = current_price * Decimal('1.01')
-            stop_loss = entry_zone_high * Decimal('1.03')
-            target_price = entry_zone_low * Decimal('0.95')
-            secondary_target = target_price * Decimal('0.98')
+        # Mock entry zone, stop loss and target prices
+        entry_zone_low, entry_zone_high, stop_loss, target_price, secondary_target = (
+            snapshot['levels'][bool(pattern_type.is_bullish)]
+        )
             
         # Calculate completion percentage based on confidence
-        completion_percentage = confidence * Decimal('0.9')
+        completion_percentage = confidence * COMPLETION_RATIO
             
         # Create a detected pattern
         pattern = DetectedPattern(
@@ -117,32 +164,33 @@ class PatternRecognitionService:
             timeframe=self.timeframe,
             status=PatternStatus.FORMING,
             confidence=confidence,
-            price_at_detection=current_price,
+            price_at_detection=snapshot['current_price'],
             entry_zone_low=entry_zone_low,
             entry_zone_high=entry_zone_high,
             stop_loss=stop_loss,
             target_price=target_price,
             secondary_target=secondary_target,
-            pattern_start_time=timezone.now() - timezone.timedelta(hours=24),
+            pattern_start_time=snapshot['pattern_start_time'],
             description=description,
             completion_percentage=completion_percentage
         )
         
         return pattern
     
-    def _detect_harmonic_pattern(self, data, pattern_type):
+    def _detect_harmonic_pattern(self, data, pattern_type, snapshot=None):
         """
         Detect harmonic patterns using Fibonacci ratios.
         
         Args:
             data: OHLCV data
             pattern_type: PatternType instance
+            snapshot: Result of _market_snapshot for data (optional)
             
         Returns:
             DetectedPattern or None
         """
         # Similar to technical patterns, but with additional Fibonacci ratio calculations
-        pattern = self._detect_technical_pattern(data, pattern_type)
+        pattern = self._detect_technical_pattern(data, pattern_type, snapshot)
         
         if pattern:
             # Add harmonic-specific Fibonacci ratios
@@ -155,13 +203,14 @@ class PatternRecognitionService:
             
         return pattern
         
-    def _detect_candlestick_pattern(self, data, pattern_type):
+    def _detect_candlestick_pattern(self, data, pattern_type, snapshot=None):
         """
         Detect candlestick patterns.
         
         Args:
             data: OHLCV data
             pattern_type: PatternType instance
+            snapshot: Result of _market_snapshot for data (optional)
             
         Returns:
             DetectedPattern or None
@@ -170,12 +219,14 @@ class PatternRecognitionService:
         # In a real implementation, this would check specific candlestick formations
         
         # For demo purposes, use similar logic to technical patterns
-        pattern = self._detect_technical_pattern(data, pattern_type)
+        pattern = self._detect_technical_pattern(data, pattern_type, snapshot)
         
         # For candlestick patterns, we typically have higher confidence
         if pattern:
             # Increase confidence for candlestick patterns
-            pattern.confidence = min(pattern.confidence * Decimal('1.1'), Decimal('95'))
+            pattern.confidence = min(
+                pattern.confidence * CANDLESTICK_CONFIDENCE_BOOST, MAX_CANDLESTICK_CONFIDENCE
+            )
             
         return pattern
     
@@ -189,6 +240,21 @@ class PatternRecognitionService:
         Returns:
             list: Saved DetectedPattern instances
         """
+        if not patterns:
+            return []
+        
+        # bulk_create skips save(), so fill in the stored ratio here
+        for pattern in patterns:
+            pattern.risk_reward_ratio = pattern.calculate_risk_reward_ratio()
+        
+        try:
+            DetectedPattern.objects.bulk_create(patterns, batch_size=SAVE_BATCH_SIZE)
+            logger.info(f"Saved {len(patterns)} patterns for {self.pair.name} ({self.timeframe})")
+            return patterns
+        except Exception as e:
+            logger.error(f"Error bulk saving patterns, saving one by one: {str(e)}")
+        
+        # Fall back to individual saves so one bad row doesn't drop the rest
         saved_patterns = []
         
         for pattern in patterns:
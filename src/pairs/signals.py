@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import PatternType
+from .utils import clear_pattern_types_cache
+
+
+@receiver([post_save, post_delete], sender=PatternType)
+def pattern_type_changed(sender, **kwargs):
+    """
+    Drop the cached pattern types whenever a pattern type changes
+    """
+    clear_pattern_types_cache()
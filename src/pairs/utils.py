@@ -0,0 +1,41 @@
+import time
+from django.core.cache import cache
+from .models import PatternType
+
+# Seconds the active pattern types are cached
+PATTERN_TYPES_CACHE_TIMEOUT = 5 * 60
+PATTERN_TYPES_VERSION_KEY = "pairs:pattern_types:version"
+
+
+def _pattern_types_key():
+    # A missing version starts a fresh one rather than reusing an old key
+    version = cache.get_or_set(PATTERN_TYPES_VERSION_KEY, time.time_ns, timeout=None)
+    return f"pairs:pattern_types:{version}"
+
+
+def get_active_pattern_types():
+    """
+    Get the active pattern types
+
+    Pattern types only change through the admin or the populate_pattern_types
+    command, so they are cached for PATTERN_TYPES_CACHE_TIMEOUT seconds under
+    a versioned key that clear_pattern_types_cache bumps.
+
+    Returns:
+        tuple: PatternType instances in the model's default ordering
+    """
+    return cache.get_or_set(
+        _pattern_types_key(),
+        lambda: tuple(PatternType.objects.filter(is_active=True)),
+        timeout=PATTERN_TYPES_CACHE_TIMEOUT
+    )
+
+
+def clear_pattern_types_cache():
+    """
+    Move every process on to a new pattern types key
+
+    Bumping the version rather than deleting the entry means a reader that
+    loaded the old rows just before the change can't cache them again.
+    """
+    cache.set(PATTERN_TYPES_VERSION_KEY, time.time_ns(), timeout=None)
@@ -2,9 +2,11 @@ from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from datetime import timedelta
+from decimal import Decimal, InvalidOperation
 
 from .models import PatternType, DetectedPattern, PatternCategory, PatternStatus
 from .serializers import (
@@ -13,6 +15,29 @@ from .serializers import (
     PatternSummarySerializer
 )
 
+# Choice payloads are static, so build them once at import time
+PATTERN_CATEGORY_CHOICES = [
+    {'value': value, 'display': display}
+    for value, display in PatternCategory.choices
+]
+PATTERN_STATUSES = frozenset(PatternStatus.values)
+FINAL_STATUSES = frozenset([
+    PatternStatus.COMPLETE,
+    PatternStatus.FAILED,
+    PatternStatus.TARGET_HIT
+])
+
+
+def _int_param(request, name, default):
+    """
+    Read an integer query parameter, falling back to default when it's
+    missing or not a number
+    """
+    try:
+        return int(request.query_params.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
 
 class PatternTypeViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -49,11 +74,7 @@ class PatternTypeViewSet(viewsets.ReadOnlyModelViewSet):
         """
         Return a list of all pattern categories
         """
-        categories = [
-            {'value': cat[0], 'display': cat[1]}
-            for cat in PatternCategory.choices
-        ]
-        return Response(categories)
+        return Response(PATTERN_CATEGORY_CHOICES)
 
 
 class DetectedPatternViewSet(viewsets.ModelViewSet):
@@ -68,11 +89,11 @@ class DetectedPatternViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Filter patterns based on query parameters"""
-        # Start with all patterns, or only the user's if they're not staff
-        if self.request.user.is_staff:
-            queryset = DetectedPattern.objects.all()
-        else:
-            queryset = DetectedPattern.objects.filter(
+        # Start with all patterns, or only the user's if they're not staff.
+        # Both serializers read the pattern type and pair of every row
+        queryset = DetectedPattern.objects.select_related('pattern_type', 'pair')
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(
                 Q(user=self.request.user) | Q(user__isnull=True)
             )
             
@@ -113,8 +134,13 @@ class DetectedPatternViewSet(viewsets.ModelViewSet):
                 
         # Filter by minimum confidence
         min_confidence = self.request.query_params.get('min_confidence')
-        if min_confidence and min_confidence.isdigit():
-            queryset = queryset.filter(confidence__gte=min_confidence)
+        if min_confidence:
+            try:
+                min_confidence = Decimal(min_confidence)
+            except InvalidOperation:
+                min_confidence = None
+            if min_confidence is not None and min_confidence.is_finite():
+                queryset = queryset.filter(confidence__gte=min_confidence)
             
         # Filter by time range
         time_range = self.request.query_params.get('time_range')
@@ -140,6 +166,17 @@ class DetectedPatternViewSet(viewsets.ModelViewSet):
             return PatternSummarySerializer
         return super().get_serializer_class()
     
+    def list(self, request, *args, **kwargs):
+        """
+        List pattern summaries, built from plain rows rather than model instances
+        """
+        rows = PatternSummarySerializer.values_rows(self.filter_queryset(self.get_queryset()))
+        
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(PatternSummarySerializer.values_data(page))
+        return Response(PatternSummarySerializer.values_data(rows))
+    
     def perform_create(self, serializer):
         """Automatically assign the current user when creating a pattern"""
         serializer.save(user=self.request.user)
@@ -160,26 +197,27 @@ class DetectedPatternViewSet(viewsets.ModelViewSet):
             
         try:
             new_status = new_status.upper()
-            if new_status not in [s[0] for s in PatternStatus.choices]:
+            if new_status not in PATTERN_STATUSES:
                 raise ValueError(f"Invalid status: {new_status}")
                 
             # Update status and completion time if moving to a final state
-            if new_status in [PatternStatus.COMPLETE, PatternStatus.FAILED, PatternStatus.TARGET_HIT]:
-                pattern.status = new_status
-                if not pattern.completion_time:
-                    pattern.completion_time = timezone.now()
-            else:
-                pattern.status = new_status
+            pattern.status = new_status
+            update_fields = ['status']
+            if new_status in FINAL_STATUSES and not pattern.completion_time:
+                pattern.completion_time = timezone.now()
+                update_fields.append('completion_time')
                 
             # Update completion percentage if provided
             completion_percentage = request.data.get('completion_percentage')
             if completion_percentage is not None:
                 try:
                     pattern.completion_percentage = float(completion_percentage)
+                    update_fields.append('completion_percentage')
                 except ValueError:
                     pass
                     
-            pattern.save()
+            # Only write the columns that changed
+            pattern.save(update_fields=update_fields)
             return Response(DetectedPatternSerializer(pattern).data)
             
         except Exception as e:
@@ -202,15 +240,10 @@ class DetectedPatternViewSet(viewsets.ModelViewSet):
         queryset = queryset.filter(detection_time__gte=week_ago)
         
         # Use limit if provided, otherwise default to 10
-        limit = request.query_params.get('limit', 10)
-        try:
-            limit = int(limit)
-        except ValueError:
-            limit = 10
+        limit = _int_param(request, 'limit', 10)
             
-        queryset = queryset[:limit]
-        serializer = PatternSummarySerializer(queryset, many=True)
-        return Response(serializer.data)
+        rows = PatternSummarySerializer.values_rows(queryset)[:limit]
+        return Response(PatternSummarySerializer.values_data(rows))
         
     @action(detail=False, methods=['get'])
     def recently_completed(self, request):
@@ -226,34 +259,37 @@ class DetectedPatternViewSet(viewsets.ModelViewSet):
         queryset = queryset.filter(completion_time__gte=month_ago)
         
         # Use limit if provided, otherwise default to 10
-        limit = request.query_params.get('limit', 10)
-        try:
-            limit = int(limit)
-        except ValueError:
-            limit = 10
+        limit = _int_param(request, 'limit', 10)
             
-        queryset = queryset[:limit]
-        serializer = PatternSummarySerializer(queryset, many=True)
-        return Response(serializer.data)
+        rows = PatternSummarySerializer.values_rows(queryset)[:limit]
+        return Response(PatternSummarySerializer.values_data(rows))
         
     @action(detail=False, methods=['get'])
     def by_category(self, request):
         """
         Get patterns grouped by category
         """
+        # Rank patterns within each category and keep the newest five of each
+        # in a single query
+        queryset = self.get_queryset().annotate(
+            category_rank=Window(
+                expression=RowNumber(),
+                partition_by=F('pattern_type__category'),
+                order_by=F('detection_time').desc()
+            )
+        ).filter(category_rank__lte=5).order_by('-detection_time')
+        
+        rows_by_category = {}
+        for row in PatternSummarySerializer.values_rows(queryset, 'pattern_type__category'):
+            rows_by_category.setdefault(row['pattern_type__category'], []).append(row)
+        
         result = {}
-        for category in PatternCategory.choices:
-            category_code = category[0]
-            category_name = category[1]
-            
-            queryset = self.get_queryset().filter(
-                pattern_type__category=category_code
-            ).order_by('-detection_time')[:5]
-            
-            serializer = PatternSummarySerializer(queryset, many=True)
+        for category_code, category_name in PatternCategory.choices:
             result[category_code] = {
                 'name': category_name,
-                'patterns': serializer.data
+                'patterns': PatternSummarySerializer.values_data(
+                    rows_by_category.get(category_code, [])
+                )
             }
             
-        return Response(result) 
\ No newline at end of file
+        return Response(result)
\ No newline at end of file
@@ -0,0 +1,114 @@
+# Generated by Django 5.0.7 on 2026-10-15 08:17
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Instrument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='Name')),
+                ('description', models.TextField(blank=True, verbose_name='Description')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Instrument',
+                'verbose_name_plural': 'Instruments',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TradingPair',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=20, unique=True, verbose_name='Name')),
+                ('base_asset', models.CharField(max_length=10, verbose_name='Base Asset')),
+                ('quote_asset', models.CharField(max_length=10, verbose_name='Quote Asset')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Trading Pair',
+                'verbose_name_plural': 'Trading Pairs',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SignalReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+                ('price', models.DecimalField(decimal_places=8, max_digits=20, verbose_name='Current Price')),
+                ('buy_signals', models.PositiveIntegerField(default=0, verbose_name='Buy Signals')),
+                ('sell_signals', models.PositiveIntegerField(default=0, verbose_name='Sell Signals')),
+                ('hold_signals', models.PositiveIntegerField(default=0, verbose_name='Hold Signals')),
+                ('avg_confidence', models.DecimalField(decimal_places=2, default=0, max_digits=5, verbose_name='Average Confidence')),
+                ('avg_risk_reward', models.DecimalField(decimal_places=2, default=0, max_digits=8, null=True, verbose_name='Average Risk/Reward')),
+                ('data', models.JSONField(blank=True, default=dict, verbose_name='Additional Data')),
+                ('user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='signal_reports', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports', to='signals.tradingpair', verbose_name='Trading Pair')),
+            ],
+            options={
+                'verbose_name': 'Signal Report',
+                'verbose_name_plural': 'Signal Reports',
+                'ordering': ['-timestamp'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Signal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('signal_type', models.CharField(choices=[('BUY', 'Buy'), ('SELL', 'Sell'), ('HOLD', 'Hold')], default='HOLD', max_length=4, verbose_name='Signal Type')),
+                ('price', models.DecimalField(decimal_places=8, max_digits=20, verbose_name='Current Price')),
+                ('entry_price', models.DecimalField(blank=True, decimal_places=8, max_digits=20, null=True, verbose_name='Entry Price')),
+                ('stop_loss', models.DecimalField(blank=True, decimal_places=8, max_digits=20, null=True, verbose_name='Stop Loss')),
+                ('take_profit', models.DecimalField(blank=True, decimal_places=8, max_digits=20, null=True, verbose_name='Take Profit')),
+                ('potential_gain', models.DecimalField(blank=True, decimal_places=2, max_digits=8, null=True, verbose_name='Potential Gain (%)')),
+                ('risk_reward_ratio', models.DecimalField(blank=True, decimal_places=2, max_digits=8, null=True, verbose_name='Risk/Reward Ratio')),
+                ('confidence', models.DecimalField(decimal_places=2, max_digits=5, verbose_name='Confidence')),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+                ('is_executed', models.BooleanField(default=False, verbose_name='Executed')),
+                ('execution_time', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='signals', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signals', to='signals.tradingpair', verbose_name='Trading Pair')),
+            ],
+            options={
+                'verbose_name': 'Trading Signal',
+                'verbose_name_plural': 'Trading Signals',
+                'ordering': ['-timestamp'],
+            },
+        ),
+        migrations.CreateModel(
+            name='WeightedInstrument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weight', models.PositiveIntegerField(help_text='Weight (1-100) assigned to this instrument for this pair. Sum of weights per pair must be 100.', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(100)], verbose_name='Weight')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('instrument', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weighted_instances', to='signals.instrument', verbose_name='Instrument')),
+                ('pair', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weighted_instruments', to='signals.tradingpair', verbose_name='Trading Pair')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weighted_instruments', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Weighted Instrument',
+                'verbose_name_plural': 'Weighted Instruments',
+                'ordering': ['-weight'],
+                'unique_together': {('user', 'pair', 'instrument')},
+            },
+        ),
+    ]
@@ -63,27 +63,39 @@ SUBSCRIPTION_LIMITS = {
     'yearly': YEARLY_PRO_TIER_LIMITS,
 }
 
-# Function to get limits for a specific subscription
-def get_subscription_limits(subscription=None):
+# Function to get the tier of a specific subscription
+def get_subscription_tier(subscription=None):
     """
-    Get the feature limits for a specific subscription
+    Get the tier name for a specific subscription
     
     Args:
         subscription: Subscription instance or None for free tier
         
     Returns:
-        dict: Dictionary of feature limits
+        str: Key into SUBSCRIPTION_LIMITS
     """
     if subscription is None or not subscription.is_active:
-        return FREE_TIER_LIMITS
+        return 'free'
     
     # Get the subscription plan's billing period
     billing_period = subscription.plan.billing_period
     
-    if billing_period == 'yearly':
-        return YEARLY_PRO_TIER_LIMITS
-    elif billing_period == 'monthly':
-        return MONTHLY_PRO_TIER_LIMITS
+    if billing_period in ('yearly', 'monthly'):
+        return billing_period
     else:
         # Fallback to free tier
-        return FREE_TIER_LIMITS 
\ No newline at end of file
+        return 'free'
+
+
+# Function to get limits for a specific subscription
+def get_subscription_limits(subscription=None):
+    """
+    Get the feature limits for a specific subscription
+    
+    Args:
+        subscription: Subscription instance or None for free tier
+        
+    Returns:
+        dict: Dictionary of feature limits
+    """
+    return SUBSCRIPTION_LIMITS[get_subscription_tier(subscription)] 
\ No newline at end of file
@@ -1 +1,16 @@
- 
\ No newline at end of file
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Subscription
+from .utils import active_subscription_cache_key, subscription_tier_cache_key
+
+
+@receiver([post_save, post_delete], sender=Subscription)
+def clear_active_subscription_cache(sender, instance, **kwargs):
+    """
+    Drop the cached subscription status and tier whenever a subscription changes
+    """
+    cache.delete_many([
+        active_subscription_cache_key(instance.user_id),
+        subscription_tier_cache_key(instance.user_id),
+    ])
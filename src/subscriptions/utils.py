@@ -1,10 +1,30 @@
 import logging
+from django.core.cache import cache
+from django.db import DatabaseError
 from django.utils import timezone
 from .models import Subscription
-from .config import get_subscription_limits
+from .config import SUBSCRIPTION_LIMITS, get_subscription_tier
 
 logger = logging.getLogger(__name__)
 
+# Short TTLs bound staleness for expiring periods; saves clear the key anyway
+ACTIVE_SUBSCRIPTION_TTL = 30
+INACTIVE_SUBSCRIPTION_TTL = 5
+
+
+def active_subscription_cache_key(user_id):
+    """
+    Cache key for a user's has_active_subscription result
+    """
+    return f"subscription_active:{user_id}"
+
+
+def subscription_tier_cache_key(user_id):
+    """
+    Cache key for the tier behind a user's get_user_limits result
+    """
+    return f"subscription_tier:{user_id}"
+
 
 def has_active_subscription(user):
     """
@@ -19,14 +39,29 @@ def has_active_subscription(user):
     if not user or not user.is_authenticated:
         return False
     
+    key = active_subscription_cache_key(user.pk)
+    is_active = cache.get(key)
+    if is_active is not None:
+        return is_active
+    
     try:
         subscription = Subscription.objects.get(user=user)
-        return subscription.is_active
+        is_active = subscription.is_active
     except Subscription.DoesNotExist:
-        return False
+        is_active = False
+    except DatabaseError:
+        # An outage is not a missing subscription; callers decide what to serve
+        raise
     except Exception as e:
         logger.error(f"Error checking active subscription: {str(e)}")
         return False
+    
+    cache.set(
+        key,
+        is_active,
+        ACTIVE_SUBSCRIPTION_TTL if is_active else INACTIVE_SUBSCRIPTION_TTL
+    )
+    return is_active
 
 
 def get_user_subscription(user):
@@ -43,7 +78,7 @@ def get_user_subscription(user):
         return None
     
     try:
-        return Subscription.objects.get(user=user)
+        return Subscription.objects.select_related('plan').get(user=user)
     except Subscription.DoesNotExist:
         return None
     except Exception as e:
@@ -61,8 +96,19 @@ def get_user_limits(user):
     Returns:
         dict: Dictionary of feature limits
     """
-    subscription = get_user_subscription(user)
-    return get_subscription_limits(subscription)
+    if not user or not user.is_authenticated:
+        return SUBSCRIPTION_LIMITS['free']
+    
+    key = subscription_tier_cache_key(user.pk)
+    tier = cache.get(key)
+    if tier is None:
+        tier = get_subscription_tier(get_user_subscription(user))
+        cache.set(
+            key,
+            tier,
+            INACTIVE_SUBSCRIPTION_TTL if tier == 'free' else ACTIVE_SUBSCRIPTION_TTL
+        )
+    return SUBSCRIPTION_LIMITS[tier]
 
 
 def can_use_feature(user, feature_name):
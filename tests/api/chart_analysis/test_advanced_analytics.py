@@ -0,0 +1,54 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db import OperationalError
+from django.utils import timezone
+from model_bakery import baker
+from chart_analysis.utils import analytics_cache_key
+from chart_analysis.views import AdvancedAnalyticsViewSet
+from subscriptions.models import Subscription
+from subscriptions.utils import active_subscription_cache_key
+
+RISK_ANALYSIS_URL = "/api/v1/chart-analysis/advanced-analytics/risk_analysis/"
+
+
+@pytest.fixture
+def premium_user(user):
+    baker.make(Subscription, user=user, status="active", current_period_end=timezone.now() + timedelta(days=30))
+    return user
+
+
+def _database_down():
+    # Neither the subscription check nor the payload build can reach the database
+    return (
+        mock.patch.object(Subscription.objects, "get", side_effect=OperationalError),
+        mock.patch.object(AdvancedAnalyticsViewSet, "_get_risk_analysis", side_effect=OperationalError),
+    )
+
+
+def test__risk_analysis__with_database_down__serves_stale_copy(client, premium_user):
+    client.force_authenticate(premium_user)
+    fresh = client.get(RISK_ANALYSIS_URL)
+    assert fresh.status_code == 200
+    assert "X-Cache" not in fresh
+
+    # Let the fresh payload and the cached subscription flag expire
+    cache.delete_many([
+        analytics_cache_key(premium_user.id, "risk_analysis"),
+        active_subscription_cache_key(premium_user.pk),
+    ])
+    subscription_down, build_down = _database_down()
+    with subscription_down, build_down:
+        r = client.get(RISK_ANALYSIS_URL)
+    assert r.status_code == 200
+    assert r["X-Cache"] == "STALE"
+    assert r.json() == fresh.json()
+
+
+def test__risk_analysis__with_database_down_and_no_stale_copy__raises(client, premium_user):
+    client.force_authenticate(premium_user)
+    subscription_down, build_down = _database_down()
+    with subscription_down, build_down, pytest.raises(OperationalError):
+        client.get(RISK_ANALYSIS_URL)
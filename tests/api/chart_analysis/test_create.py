@@ -0,0 +1,19 @@
+def test__support_resistance__with_non_string_timeframe__returns_403(client, user):
+    client.force_authenticate(user)
+    r = client.post(
+        "/api/v1/chart-analysis/support-resistance/",
+        {"timeframe": ["1h"]},
+        format="json",
+    )
+    assert r.status_code == 403
+
+
+def test__saved_indicator__with_non_string_indicator_type__returns_400(client, user):
+    client.force_authenticate(user)
+    r = client.post(
+        "/api/v1/chart-analysis/indicators/",
+        {"indicator_type": ["fib"]},
+        format="json",
+    )
+    assert r.status_code == 400
+    assert "indicator_type" in r.json()
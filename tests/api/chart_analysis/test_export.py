@@ -0,0 +1,35 @@
+import json
+
+from model_bakery import baker
+from chart_analysis.models import Pair, SignalPerformance
+
+EXPORT_URL = "/api/v1/chart-analysis/signal-performance/export/"
+
+
+def test__export__streams_one_json_object_per_line(client, user):
+    pair = baker.make(Pair, name="EUR/USD")
+    performances = baker.make(SignalPerformance, user=user, pair=pair, result="win", _quantity=3)
+    client.force_authenticate(user)
+    r = client.get(EXPORT_URL)
+    assert r.status_code == 200
+    assert r.streaming
+    assert r["Content-Type"] == "application/x-ndjson"
+
+    lines = b"".join(r.streaming_content).decode().splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert sorted(row["id"] for row in rows) == sorted(p.id for p in performances)
+    assert all(row["pair"] == pair.id for row in rows)
+
+
+def test__export__only_includes_current_users_rows(client, user, user_factory):
+    own = baker.make(SignalPerformance, user=user)
+    baker.make(SignalPerformance, user=user_factory(is_active=True), _quantity=2)
+    client.force_authenticate(user)
+    r = client.get(EXPORT_URL)
+    rows = [json.loads(line) for line in b"".join(r.streaming_content).splitlines()]
+    assert [row["id"] for row in rows] == [own.id]
+
+
+def test__export__with_anonymous_user__returns_401(client):
+    r = client.get(EXPORT_URL)
+    assert r.status_code == 401
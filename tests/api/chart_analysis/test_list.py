@@ -0,0 +1,64 @@
+from model_bakery import baker
+from chart_analysis.models import Pair, SavedIndicator, SupportResistanceLevel
+
+# Count, page and the one-off pair name cache fill, however many rows
+LIST_QUERIES = 3
+
+
+def test__saved_indicators__query_count_does_not_grow_with_rows(client, user, django_assert_num_queries):
+    for pair in baker.make(Pair, _quantity=5):
+        baker.make(SavedIndicator, user=user, pair=pair, indicator_type="rsi")
+    client.force_authenticate(user)
+    with django_assert_num_queries(LIST_QUERIES):
+        r = client.get("/api/v1/chart-analysis/indicators/")
+    assert r.status_code == 200
+    assert len(r.json()["results"]) == 5
+
+
+def test__support_resistance__query_count_does_not_grow_with_rows(client, user, django_assert_num_queries):
+    for pair in baker.make(Pair, _quantity=5):
+        baker.make(SupportResistanceLevel, created_by=user, pair=pair, timeframe="1h", level_type="support")
+    client.force_authenticate(user)
+    with django_assert_num_queries(LIST_QUERIES):
+        r = client.get("/api/v1/chart-analysis/support-resistance/")
+    assert r.status_code == 200
+    assert len(r.json()["results"]) == 5
+
+
+def test__support_resistance_for_pair__query_count_does_not_grow_with_rows(client, user, django_assert_num_queries):
+    pair = baker.make(Pair)
+    baker.make(SupportResistanceLevel, created_by=user, pair=pair, timeframe="1h", _quantity=5)
+    client.force_authenticate(user)
+    # Subscription check for the timeframe, the levels and the pair names
+    with django_assert_num_queries(3):
+        r = client.get(f"/api/v1/chart-analysis/support-resistance/for_pair/?pair={pair.id}&timeframe=1h")
+    assert r.status_code == 200
+    assert len(r.json()) == 5
+
+
+def test__with_anonymous_user__returns_401(client):
+    r = client.get("/api/v1/chart-analysis/indicators/")
+    assert r.status_code == 401
+
+
+def test__pairs__with_matching_etag__returns_304_without_body(client, user):
+    baker.make(Pair, is_active=True, _quantity=2)
+    client.force_authenticate(user)
+    r = client.get("/api/v1/chart-analysis/pairs/")
+    assert r.status_code == 200
+    assert r["ETag"]
+
+    r = client.get("/api/v1/chart-analysis/pairs/", HTTP_IF_NONE_MATCH=r["ETag"])
+    assert r.status_code == 304
+    assert r.content == b""
+
+
+def test__pairs__with_stale_etag__returns_200(client, user):
+    baker.make(Pair, is_active=True)
+    client.force_authenticate(user)
+    etag = client.get("/api/v1/chart-analysis/pairs/")["ETag"]
+
+    baker.make(Pair, is_active=True)
+    r = client.get("/api/v1/chart-analysis/pairs/", HTTP_IF_NONE_MATCH=etag)
+    assert r.status_code == 200
+    assert r["ETag"] != etag
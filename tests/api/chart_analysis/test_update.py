@@ -0,0 +1,47 @@
+from decimal import Decimal
+
+from model_bakery import baker
+from chart_analysis.models import UserIndicatorSettings
+
+UPDATE_ALL_URL = "/api/v1/chart-analysis/indicator-settings/update_all/"
+
+
+def test__update_all__updates_every_setting(client, user):
+    rsi = baker.make(UserIndicatorSettings, user=user, indicator_type="rsi", weight=Decimal("0.5"))
+    macd = baker.make(UserIndicatorSettings, user=user, indicator_type="macd", is_active=True)
+    client.force_authenticate(user)
+    r = client.put(
+        UPDATE_ALL_URL,
+        {"settings": [{"id": rsi.id, "weight": "0.9"}, {"id": macd.id, "is_active": False}]},
+        format="json",
+    )
+    assert r.status_code == 200
+    rsi.refresh_from_db()
+    macd.refresh_from_db()
+    assert rsi.weight == Decimal("0.9")
+    assert macd.is_active is False
+
+
+def test__update_all__with_invalid_setting__writes_nothing_and_keys_errors_by_id(client, user):
+    rsi = baker.make(UserIndicatorSettings, user=user, indicator_type="rsi", weight=Decimal("0.5"))
+    macd = baker.make(UserIndicatorSettings, user=user, indicator_type="macd", weight=Decimal("0.5"))
+    client.force_authenticate(user)
+    r = client.put(
+        UPDATE_ALL_URL,
+        {"settings": [{"id": rsi.id, "weight": "0.9"}, {"id": macd.id, "weight": "not a number"}]},
+        format="json",
+    )
+    assert r.status_code == 400
+    assert list(r.json()) == [str(macd.id)]
+    assert "weight" in r.json()[str(macd.id)]
+    rsi.refresh_from_db()
+    macd.refresh_from_db()
+    assert rsi.weight == Decimal("0.5")
+    assert macd.weight == Decimal("0.5")
+
+
+def test__update_all__with_another_users_setting__returns_404(client, user, user_factory):
+    other = baker.make(UserIndicatorSettings, user=user_factory(is_active=True), indicator_type="rsi")
+    client.force_authenticate(user)
+    r = client.put(UPDATE_ALL_URL, {"settings": [{"id": other.id, "weight": "0.9"}]}, format="json")
+    assert r.status_code == 404
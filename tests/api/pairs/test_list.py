@@ -0,0 +1,31 @@
+from model_bakery import baker
+from pairs.models import DetectedPattern, PatternCategory, PatternType
+from signals.models import TradingPair
+
+
+def make_patterns(user, category=PatternCategory.TECHNICAL, quantity=5):
+    for pair in baker.make(TradingPair, _quantity=quantity):
+        pattern_type = baker.make(PatternType, category=category)
+        baker.make(DetectedPattern, user=user, pair=pair, pattern_type=pattern_type, confidence=80)
+
+
+def test__patterns__query_count_does_not_grow_with_rows(client, user, django_assert_num_queries):
+    make_patterns(user)
+    client.force_authenticate(user)
+    # Count and page
+    with django_assert_num_queries(2):
+        r = client.get("/api/v1/pairs/patterns/")
+    assert r.status_code == 200
+    assert len(r.json()["results"]) == 5
+
+
+def test__patterns_by_category__query_count_does_not_grow_with_rows(client, user, django_assert_num_queries):
+    make_patterns(user, PatternCategory.TECHNICAL)
+    make_patterns(user, PatternCategory.HARMONIC)
+    client.force_authenticate(user)
+    # Every category's newest patterns come from one ranked query
+    with django_assert_num_queries(1):
+        r = client.get("/api/v1/pairs/patterns/by_category/")
+    assert r.status_code == 200
+    assert len(r.json()["TECHNICAL"]["patterns"]) == 5
+    assert len(r.json()["HARMONIC"]["patterns"]) == 5
@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from model_bakery import baker
+from chart_analysis.models import (
+    Pair, PairPerformance, RiskAnalysis, SignalPerformance, TimeframePerformance
+)
+
+
+@pytest.fixture
+def pairs():
+    return baker.make(Pair, name="EUR/USD"), baker.make(Pair, name="GBP/USD")
+
+
+@pytest.fixture
+def signals(user, pairs):
+    eurusd, gbpusd = pairs
+    start = timezone.now() - timedelta(days=1)
+    # Equity runs 10, 5, 25, 10, so the deepest drop from a peak is 15
+    for hours, pair, timeframe, result, profit_loss in [
+        (1, eurusd, "1h", "win", 10.0),
+        (2, eurusd, "1h", "loss", -5.0),
+        (3, eurusd, "1h", "win", 20.0),
+        (4, gbpusd, "4h", "loss", -15.0),
+        (5, gbpusd, "4h", "open", None),
+    ]:
+        baker.make(
+            SignalPerformance,
+            user=user,
+            pair=pair,
+            timeframe=timeframe,
+            result=result,
+            profit_loss=profit_loss,
+            exit_time=start + timedelta(hours=hours),
+        )
+
+
+def _snapshot():
+    return (
+        sorted(PairPerformance.objects.values_list("pair__name", "accuracy", "sample_size", "win_count", "loss_count")),
+        sorted(TimeframePerformance.objects.values_list("timeframe", "accuracy", "sample_size", "win_count", "loss_count")),
+        list(RiskAnalysis.objects.values_list(
+            "win_rate", "avg_risk_reward", "max_drawdown", "profit_factor",
+            "total_trades", "winning_trades", "losing_trades", "avg_win_size", "avg_loss_size",
+        )),
+    )
+
+
+def test__refresh_performance__aggregates_closed_signals(signals):
+    call_command("refresh_performance")
+    pair_rows, timeframe_rows, risk_rows = _snapshot()
+    assert pair_rows == [("EUR/USD", 66.67, 3, 2, 1), ("GBP/USD", 0.0, 1, 0, 1)]
+    assert timeframe_rows == [("1h", 66.67, 3, 2, 1), ("4h", 0.0, 1, 0, 1)]
+    assert risk_rows == [(50.0, 1.5, 15.0, 1.5, 4, 2, 2, 15.0, 10.0)]
+
+
+def test__refresh_performance__is_idempotent(signals):
+    call_command("refresh_performance")
+    first = _snapshot()
+    counts = (PairPerformance.objects.count(), TimeframePerformance.objects.count(), RiskAnalysis.objects.count())
+
+    call_command("refresh_performance")
+    assert _snapshot() == first
+    assert (PairPerformance.objects.count(), TimeframePerformance.objects.count(), RiskAnalysis.objects.count()) == counts
+
+
+def test__refresh_performance__removes_rows_without_closed_signals(user, user_factory, signals):
+    other = user_factory(is_active=True)
+    baker.make(PairPerformance, user=other, accuracy=80)
+    baker.make(TimeframePerformance, user=other, timeframe="1d", accuracy=80)
+    baker.make(RiskAnalysis, user=other)
+    call_command("refresh_performance")
+    assert not PairPerformance.objects.filter(user=other).exists()
+    assert not TimeframePerformance.objects.filter(user=other).exists()
+    assert not RiskAnalysis.objects.filter(user=other).exists()
+
+    SignalPerformance.objects.all().delete()
+    call_command("refresh_performance")
+    assert not PairPerformance.objects.exists()
+    assert not TimeframePerformance.objects.exists()
+    assert not RiskAnalysis.objects.exists()
@@ -2,7 +2,9 @@ from collections.abc import Callable
 
 import pytest
 from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
 from model_bakery import baker
+from chart_analysis.utils import get_active_pairs, get_pairs_by_id
 from rest_framework.test import APIClient
 from users.models import User
 
@@ -18,6 +20,19 @@ def pytest_collection_modifyitems(items):
         item.add_marker("django_db")
 
 
+@pytest.fixture(autouse=True)
+def clear_pairs_cache() -> None:
+    # Rolled back test transactions don't send post_delete for pairs
+    get_pairs_by_id.cache_clear()
+    get_active_pairs.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    # Cached lookups are keyed by ids that rolled back tests reuse
+    cache.clear()
+
+
 @pytest.fixture
 def client() -> APIClient:
     return APIClient()